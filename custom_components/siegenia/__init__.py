@@ -1,23 +1,34 @@
 from __future__ import annotations
 import logging
-from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 from .const import (
     DOMAIN,
     PLATFORMS,
     DATA_CLIENT,
     DATA_COORDINATOR,
-    UPDATE_INTERVAL_SECONDS,
+    DATA_OPTIONS,
+    CONF_DCV_ENABLED,
+    CONF_TOKEN,
 )
-from .api import SiegeniaClient
+from .api import OVERFLOW_COALESCE, SiegeniaClient
+from .controller import async_setup_controller
+from .coordinator import SiegeniaCoordinator
 from .device import build_device_info
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register services once for all config entries."""
+    async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Siegenia from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -27,6 +38,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data["password"]
     port = entry.data.get("port", 443)
     use_ssl = entry.data.get("use_ssl", True)
+
+    @callback
+    def _store_token(token: str | None) -> None:
+        # Persisted so restarts resume the session instead of logging in again
+        hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_TOKEN: token})
     
     client = SiegeniaClient(
         host=host,
@@ -34,41 +50,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=password,
         port=port,
         use_ssl=use_ssl,
+        token=entry.data.get(CONF_TOKEN),
+        on_token=_store_token,
     )
     
     await client.connect()
     
-    async def _async_update():
-        data: dict = {}
-        try:
-            if not client.connected:
-                await client.connect()
-            state = await client.get_device_state()
-            params = await client.get_device_params()
-            info = await client.get_device()
-            data = {"state": state, "params": params, "info": info}
-        except Exception as exc:
-            _LOGGER.debug("Update error, attempting reconnect: %s", exc)
-            await client.connect()
-            state = await client.get_device_state()
-            params = await client.get_device_params()
-            info = await client.get_device()
-            data = {"state": state, "params": params, "info": info}
-        return data
-    
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="siegenia",
-        update_method=_async_update,
-        update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
-    )
+    coordinator = SiegeniaCoordinator(hass, entry, client)
     
     await coordinator.async_config_entry_first_refresh()
     
     # Device Registry aktualisieren mit Seriennummer und Firmware
     device_registry = dr.async_get(hass)
-    info = coordinator.data.get("info", {})
+    info = coordinator.data.info
     
     # Extrahieren Sie die Werte aus Ihrer API-Antwort
     # Passen Sie die Schlüsselnamen an Ihre tatsächliche API-Struktur an
@@ -87,21 +81,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         serial_number=serial_number,
     )
     
-    try:
-        client.set_on_push(lambda _data: hass.async_create_task(coordinator.async_request_refresh()))
-    except Exception:
-        pass
+    # Pushes only trigger a refresh, so one queued frame per command is enough
+    pushes = client.subscribe(overflow=OVERFLOW_COALESCE)
+
+    async def _consume_pushes() -> None:
+        async for _frame in pushes:
+            await coordinator.async_request_refresh()
+
+    entry.async_create_background_task(hass, _consume_pushes(), f"{DOMAIN}-{entry.entry_id}-push")
+    entry.async_on_unload(pushes.close)
     
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: client,
         DATA_COORDINATOR: coordinator,
+        DATA_OPTIONS: dict(entry.options),
     }
     
     # Plattformen laden - hier werden die Entitäten erstellt
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if entry.options.get(CONF_DCV_ENABLED):
+        async_setup_controller(hass, entry, coordinator)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    # Token updates also land here and must not reload the entry
+    data = hass.data[DOMAIN].get(entry.entry_id) or {}
+    if data.get(DATA_OPTIONS) == dict(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
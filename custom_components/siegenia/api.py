@@ -4,15 +4,233 @@ import asyncio
 import json
 import logging
 import ssl
-from typing import Any, Optional
+import time
+import zlib
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, Callable, Optional
 
-from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType, WSServerHandshakeError
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 5.0
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+# Consecutive request timeouts after which an open socket is treated as dead
+DEAD_LINK_TIMEOUTS = 2
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_COALESCE = "coalesce"
+
+
+class SiegeniaStatusError(RuntimeError):
+    """The device answered a request with a status other than "ok"."""
+
+    def __init__(self, status: Any) -> None:
+        super().__init__(f"Siegenia error: {status}")
+        self.status = status
+
+
+class ConnectionState(str, Enum):
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    BACKING_OFF = "backing_off"
+
+
+def _push_key(frame: dict) -> Any:
+    return frame.get("command") or frame.get("type")
+
+
+class PushSubscription:
+    """Bounded queue of push frames for one consumer, read with ``async for``.
+
+    Frames are put without ever blocking the receiver. When the queue is full
+    the oldest frame is dropped; with ``OVERFLOW_COALESCE`` a frame whose key
+    is already queued replaces the queued one instead.
+    """
+
+    __slots__ = ("_client", "_maxsize", "_key", "_frames", "_event", "_closed", "dropped")
+
+    def __init__(
+        self,
+        client: "SiegeniaClient",
+        maxsize: int,
+        overflow: str,
+        key: Optional[Callable[[dict], Any]],
+    ) -> None:
+        if overflow not in (OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self._client = client
+        self._maxsize = max(1, maxsize)
+        self._key = (key or _push_key) if overflow == OVERFLOW_COALESCE else None
+        self._frames: deque | OrderedDict = OrderedDict() if self._key else deque()
+        self._event = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _put(self, frame: dict) -> None:
+        if self._closed:
+            return
+        frames = self._frames
+        if self._key is not None:
+            key = self._key(frame)
+            if key in frames:
+                frames[key] = frame
+                self.dropped += 1
+                return
+            if len(frames) >= self._maxsize:
+                frames.popitem(last=False)
+                self.dropped += 1
+            frames[key] = frame
+        else:
+            if len(frames) >= self._maxsize:
+                frames.popleft()
+                self.dropped += 1
+            frames.append(frame)
+        self._event.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._client._unsubscribe(self)
+        self._event.set()
+
+    def __aiter__(self) -> "PushSubscription":
+        return self
+
+    async def __anext__(self) -> dict:
+        while not self._frames:
+            if self._closed:
+                raise StopAsyncIteration
+            self._event.clear()
+            await self._event.wait()
+        if self._key is not None:
+            return self._frames.popitem(last=False)[1]
+        return self._frames.popleft()
+
+
+def _deflated_size(data: bytes, wbits: int) -> int:
+    """Payload size of ``data`` as one permessage-deflate message (RFC 7692).
+
+    Context takeover between messages is ignored, so this is an upper bound
+    of what actually goes over the air.
+    """
+    comp = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -wbits)
+    out = comp.compress(data) + comp.flush(zlib.Z_SYNC_FLUSH)
+    return len(out) - 4  # the trailing 00 00 ff ff is stripped on the wire
+
+
+class RttEstimator:
+    """Smoothed round-trip time and derived timeout, as for the TCP RTO (RFC 6298)."""
+
+    __slots__ = ("srtt", "rttvar", "timeout", "floor", "ceiling")
+
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+
+    def __init__(self, initial: float, floor: float, ceiling: float) -> None:
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.floor = floor
+        self.ceiling = ceiling
+        self.timeout = min(max(initial, floor), ceiling)
+
+    def sample(self, rtt: float) -> None:
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.timeout = min(max(self.srtt + self.K * self.rttvar, self.floor), self.ceiling)
+
+    def backoff(self) -> None:
+        """Double the timeout after an expiry until the next sample arrives."""
+        self.timeout = min(self.timeout * 2, self.ceiling)
+
+
+class CommandStats:
+    """Frame counts and raw vs. wire bytes of one command."""
+
+    __slots__ = ("count", "raw_out", "wire_out", "raw_in", "wire_in")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.raw_out = 0
+        self.wire_out = 0
+        self.raw_in = 0
+        self.wire_in = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ClientStats:
+    """Connection timings and frame counters of a SiegeniaClient.
+
+    ``bytes_*`` count the JSON text, ``wire_bytes_*`` the (estimated) payload
+    after permessage-deflate; both are equal when compression is off or the
+    client was created without ``account_wire_bytes``.
+    """
+
+    __slots__ = (
+        "connects",
+        "connect_seconds",
+        "login_seconds",
+        "frames_in",
+        "frames_out",
+        "bytes_in",
+        "bytes_out",
+        "wire_bytes_in",
+        "wire_bytes_out",
+        "max_frame_in",
+        "requests",
+        "errors",
+        "timeouts",
+        "compress",
+        "commands",
+    )
+
+    def __init__(self) -> None:
+        self.connects = 0
+        self.connect_seconds: Optional[float] = None
+        self.login_seconds: Optional[float] = None
+        self.frames_in = 0
+        self.frames_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.wire_bytes_in = 0
+        self.wire_bytes_out = 0
+        self.max_frame_in = 0
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.compress = 0  # negotiated deflate window bits, 0 when off
+        self.commands: dict[str, CommandStats] = {}
+
+    def command(self, name: str) -> CommandStats:
+        stats = self.commands.get(name)
+        if stats is None:
+            stats = self.commands[name] = CommandStats()
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        out = {name: getattr(self, name) for name in self.__slots__}
+        out["commands"] = {name: c.as_dict() for name, c in self.commands.items()}
+        return out
+
 
 class SiegeniaClient:
-    """Async WebSocket client for Siegenia devices."""
+    """Async WebSocket client for Siegenia devices.
+
+    This module only depends on aiohttp so it can also be used outside of
+    Home Assistant (see tools/siegenia_cli.py); keep it free of relative imports.
+    """
 
     def __init__(
         self,
@@ -23,6 +241,13 @@ class SiegeniaClient:
         use_ssl: bool = True,
         heartbeat_seconds: int = 10,
         session: Optional[ClientSession] = None,
+        compress: bool = True,
+        timeout_floor: float = 1.0,
+        timeout_ceiling: float = 10.0,
+        token: Optional[str] = None,
+        on_token: Optional[Callable[[Optional[str]], None]] = None,
+        auto_reconnect: bool = True,
+        account_wire_bytes: bool = False,
     ) -> None:
         self._host = host
         self._username = username
@@ -33,12 +258,28 @@ class SiegeniaClient:
         self._session = session
         self._ws: Optional[ClientWebSocketResponse] = None
         self._req_id = 0
-        self._pending: dict[int, asyncio.Future] = {}
+        self._pending: dict[int, tuple[asyncio.Future, str]] = {}
+        self._timeout_floor = timeout_floor
+        self._timeout_ceiling = timeout_ceiling
+        self._rtt: dict[str, RttEstimator] = {}
+        self._consecutive_timeouts = 0
+        # Offer permessage-deflate until a handshake fails with it but succeeds without
+        self._offer_deflate = compress
+        # Estimating deflated sizes recompresses every frame; only for diagnostics
+        self._account_wire = account_wire_bytes
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._receiver_task: Optional[asyncio.Task] = None
-        self._token: Optional[str] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._auto_reconnect = auto_reconnect
+        self._closing = False
+        self.state = ConnectionState.DISCONNECTED
+        self._state_listeners: list[Callable[[ConnectionState], None]] = []
+        self._token: Optional[str] = token
+        self.on_token = on_token  # called whenever the session token changes
         self.on_push = None  # optional callback for unsolicited frames
+        self._subscriptions: list[PushSubscription] = []
         self._connect_lock: asyncio.Lock = asyncio.Lock()
+        self.stats = ClientStats()
 
     @property
     def connected(self) -> bool:
@@ -47,6 +288,48 @@ class SiegeniaClient:
     def set_on_push(self, callback) -> None:
         self.on_push = callback
 
+    def add_state_listener(self, callback: Callable[[ConnectionState], None]) -> Callable[[], None]:
+        """Call ``callback`` on every connection state transition; returns a remover."""
+        self._state_listeners.append(callback)
+
+        def _remove() -> None:
+            if callback in self._state_listeners:
+                self._state_listeners.remove(callback)
+
+        return _remove
+
+    def _set_state(self, state: ConnectionState) -> None:
+        if state is self.state:
+            return
+        _LOGGER.debug("Connection %s: %s -> %s", self._host, self.state.value, state.value)
+        self.state = state
+        for callback in list(self._state_listeners):
+            try:
+                callback(state)
+            except Exception as exc:
+                _LOGGER.debug("State listener error: %s", exc)
+
+    def subscribe(
+        self,
+        maxsize: int = 32,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        key: Optional[Callable[[dict], Any]] = None,
+    ) -> PushSubscription:
+        """Return an async iterator over push frames with its own bounded queue.
+
+        ``key`` selects the coalescing key for ``OVERFLOW_COALESCE`` and
+        defaults to the frame's ``command``.
+        """
+        sub = PushSubscription(self, maxsize, overflow, key)
+        self._subscriptions.append(sub)
+        return sub
+
+    def _unsubscribe(self, sub: PushSubscription) -> None:
+        try:
+            self._subscriptions.remove(sub)
+        except ValueError:
+            pass
+
     @staticmethod
     def _iter_json_objects(raw: str):
         decoder = json.JSONDecoder()
@@ -64,32 +347,67 @@ class SiegeniaClient:
         async with self._connect_lock:
             if self.connected:
                 return
+            self._closing = False
+            self._set_state(ConnectionState.CONNECTING)
+            try:
+                await self._open()
+            except BaseException:
+                ws, self._ws = self._ws, None
+                if ws is not None and not ws.closed:
+                    await ws.close()
+                self._set_state(ConnectionState.DISCONNECTED)
+                raise
+            self._set_state(ConnectionState.CONNECTED)
 
-            if self._session is None:
-                self._session = ClientSession()
+    async def _open(self) -> None:
+        if self._session is None:
+            self._session = ClientSession()
 
-            scheme = "wss" if self._use_ssl else "ws"
-            url = f"{scheme}://{self._host}:{self._port}/WebSocket"
+        scheme = "wss" if self._use_ssl else "ws"
+        url = f"{scheme}://{self._host}:{self._port}/WebSocket"
 
-            ssl_ctx = None
-            if self._use_ssl:
-                loop = asyncio.get_event_loop()
-                ssl_ctx = await loop.run_in_executor(None, ssl.create_default_context)
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
+        ssl_ctx = None
+        if self._use_ssl:
+            loop = asyncio.get_event_loop()
+            ssl_ctx = await loop.run_in_executor(None, ssl.create_default_context)
+            ssl_ctx.check_hostname = False
+            ssl_ctx.verify_mode = ssl.CERT_NONE
 
-            _LOGGER.debug("Connecting WS to %s", url)
+        _LOGGER.debug("Connecting WS to %s", url)
+        started = time.perf_counter()
+        headers = {"Origin": f"{scheme}://{self._host}:{self._port}"}
+        try:
             self._ws = await self._session.ws_connect(
-                url,
-                ssl=ssl_ctx,
-                headers={"Origin": f"{scheme}://{self._host}:{self._port}"},
+                url, ssl=ssl_ctx, headers=headers, compress=15 if self._offer_deflate else 0
             )
+        except WSServerHandshakeError as exc:
+            if not self._offer_deflate:
+                raise
+            _LOGGER.debug("Handshake with deflate offer failed (%s), retrying without", exc)
+            # A plain retry failing too means the device is not ready (booting,
+            # 401/503, ...), not that it refuses deflate; keep offering it then
+            self._ws = await self._session.ws_connect(url, ssl=ssl_ctx, headers=headers, compress=0)
+            _LOGGER.debug("Device refuses permessage-deflate, no longer offering it")
+            self._offer_deflate = False
+        # aiohttp silently disables compression when the device ignores the offer
+        self.stats.compress = self._ws.compress or 0
+        self.stats.connects += 1
+        self.stats.connect_seconds = time.perf_counter() - started
+
+        # Start receiver and heartbeat, then login
+        self._receiver_task = asyncio.create_task(self._receiver())
+        started = time.perf_counter()
+        await self._resume_or_login()
+        self.stats.login_seconds = time.perf_counter() - started
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        _LOGGER.debug("WS connected")
 
-            # Start receiver and heartbeat, then login
-            self._receiver_task = asyncio.create_task(self._receiver())
-            await self.login(self._username, self._password)
-            self._heartbeat_task = asyncio.create_task(self._heartbeat())
-            _LOGGER.debug("WS connected")
+    def _wire_size(self, encoded: bytes) -> int:
+        if self._account_wire and self.stats.compress:
+            return _deflated_size(encoded, self.stats.compress)
+        return len(encoded)
 
     # FIX 1: _receiver gehört zur Klasse (4-Space-Einrückung)
     async def _receiver(self) -> None:
@@ -97,6 +415,14 @@ class SiegeniaClient:
         ws = self._ws
         async for msg in ws:
             if msg.type == WSMsgType.TEXT:
+                encoded = msg.data.encode()
+                size = len(encoded)
+                wire = self._wire_size(encoded)
+                self.stats.frames_in += 1
+                self.stats.bytes_in += size
+                self.stats.wire_bytes_in += wire
+                if size > self.stats.max_frame_in:
+                    self.stats.max_frame_in = size
                 raw_data = msg.data.strip()
                 json_objects = []
                 decoder = json.JSONDecoder()
@@ -109,20 +435,27 @@ class SiegeniaClient:
                         break
                     try:
                         obj, end_idx = decoder.raw_decode(raw_data, idx)
-                        json_objects.append(obj)
+                        json_objects.append((obj, end_idx - idx))
                         idx = end_idx  # FIX 2: = statt +=  (end_idx ist absolut, nicht relativ)
                     except json.JSONDecodeError as exc:
                         _LOGGER.warning("WS JSON error: %s (at position %d in: %s)", exc, idx, raw_data)
                         break
 
-                for data in json_objects:
+                for data, length in json_objects:
                     rid = data.get("id")
                     status = data.get("status")
                     payload = data.get("data")
-                    fut = self._pending.pop(rid, None)
-                    if fut is not None and not fut.done():
+                    pending = self._pending.pop(rid, None)
+                    if pending is not None:
+                        fut, command = pending
+                        cmd_stats = self.stats.command(command)
+                        cmd_stats.raw_in += length
+                        cmd_stats.wire_in += length * wire // max(1, size)
+                    if pending is not None and not fut.done():
                         fut.set_result((status, payload))
                     else:
+                        for sub in self._subscriptions:
+                            sub._put(data)
                         try:
                             if callable(self.on_push):
                                 self.on_push(data)
@@ -135,13 +468,50 @@ class SiegeniaClient:
 
         # mark closed
         try:
-            if self._ws and not self._ws.closed:
-                await self._ws.close()
+            if not ws.closed:
+                await ws.close()
         except Exception:
             pass
+        if self._ws is not ws:
+            return  # already replaced by a newer connection
         self._ws = None
+        was_connected = self.state is ConnectionState.CONNECTED
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._fail_pending(ConnectionError("Siegenia connection lost"))
+        self._set_state(ConnectionState.DISCONNECTED)
+        if was_connected and self._auto_reconnect and not self._closing:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for fut, _command in pending.values():
+            if not fut.done():
+                fut.set_exception(exc)
+
+    async def _reconnect(self) -> None:
+        delay = 0.0
+        while not self._closing and not self.connected:
+            if delay:
+                self._set_state(ConnectionState.BACKING_OFF)
+                await asyncio.sleep(delay)
+            try:
+                await self.connect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                _LOGGER.debug("Reconnect to %s failed: %s", self._host, exc)
+            delay = min(max(delay * 2, RECONNECT_MIN_SECONDS), RECONNECT_MAX_SECONDS)
+        self._reconnect_task = None
 
     async def close(self) -> None:
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        for sub in list(self._subscriptions):
+            sub.close()
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
             self._heartbeat_task = None
@@ -151,11 +521,26 @@ class SiegeniaClient:
         if self._ws and not self._ws.closed:
             await self._ws.close()
         self._ws = None
+        self._fail_pending(ConnectionError("Siegenia client closed"))
+        self._set_state(ConnectionState.DISCONNECTED)
         if self._session and not self._session.closed:
             await self._session.close()
         self._session = None
 
-    async def _send(self, command: Any, params: Optional[dict] = None, timeout: float = 5.0):
+    def rtt_estimator(self, command: str) -> RttEstimator:
+        est = self._rtt.get(command)
+        if est is None:
+            est = self._rtt[command] = RttEstimator(
+                DEFAULT_TIMEOUT, self._timeout_floor, self._timeout_ceiling
+            )
+        return est
+
+    async def _send(self, command: Any, params: Optional[dict] = None, timeout: Optional[float] = None):
+        """Send a request and wait for its reply.
+
+        Without an explicit ``timeout`` the command's RTT estimate decides how
+        long to wait, bounded by the client's timeout floor and ceiling.
+        """
         if not self.connected:
             await self.connect()
             if not self.connected:
@@ -172,36 +557,102 @@ class SiegeniaClient:
             req["params"] = params
         req["id"] = rid
 
+        name = str(req.get("command"))
         loop = asyncio.get_event_loop()
         fut: asyncio.Future = loop.create_future()
-        self._pending[rid] = fut
+        self._pending[rid] = (fut, name)
 
+        frame = json.dumps(req)
+        self.stats.requests += 1
+        est = self.rtt_estimator(name)
+        resent = False
+        started = time.perf_counter()
         try:
             assert self._ws is not None
-            await self._ws.send_str(json.dumps(req))
+            await self._ws.send_str(frame)
         except Exception:
             # reconnect once and retry
+            resent = True
             await self.connect()
             try:
                 assert self._ws is not None
-                await self._ws.send_str(json.dumps(req))
+                await self._ws.send_str(frame)
             except Exception as exc:
                 self._pending.pop(rid, None)
+                self.stats.errors += 1
                 raise
+        encoded = frame.encode()
+        wire = self._wire_size(encoded)
+        self.stats.frames_out += 1
+        self.stats.bytes_out += len(encoded)
+        self.stats.wire_bytes_out += wire
+        cmd_stats = self.stats.command(name)
+        cmd_stats.count += 1
+        cmd_stats.raw_out += len(encoded)
+        cmd_stats.wire_out += wire
 
         try:
-            status, payload = await asyncio.wait_for(fut, timeout=timeout)
+            status, payload = await asyncio.wait_for(fut, timeout=est.timeout if timeout is None else timeout)
         except asyncio.TimeoutError:
             self._pending.pop(rid, None)
+            self.stats.timeouts += 1
+            est.backoff()
+            self._consecutive_timeouts += 1
+            ws = self._ws
+            if self._consecutive_timeouts >= DEAD_LINK_TIMEOUTS and ws is not None and not ws.closed:
+                # Half-open socket: closing it hands over to the reconnect logic
+                _LOGGER.debug("%d requests to %s timed out, dropping the connection", self._consecutive_timeouts, self._host)
+                self._consecutive_timeouts = 0
+                await ws.close()
             raise TimeoutError("Siegenia request timed out")
+        self._consecutive_timeouts = 0
+        # Karn's rule: a resent request gives an ambiguous sample
+        if not resent:
+            est.sample(time.perf_counter() - started)
         if status != "ok":
-            raise RuntimeError(f"Siegenia error: {status}")
+            self.stats.errors += 1
+            raise SiegeniaStatusError(status)
         return payload
 
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    def _set_token(self, token: Optional[str]) -> None:
+        if token == self._token:
+            return
+        self._token = token
+        if callable(self.on_token):
+            try:
+                self.on_token(token)
+            except Exception as exc:
+                _LOGGER.debug("on_token callback error: %s", exc)
+
+    async def _resume_or_login(self) -> None:
+        if self._token:
+            try:
+                await self.login_token(self._token)
+                return
+            except SiegeniaStatusError as exc:
+                # Only a refusal invalidates the token; timeouts and dropped
+                # connections propagate and the token is kept for the retry
+                _LOGGER.debug("Session token rejected (%s), falling back to password login", exc)
+                self._set_token(None)
+        await self.login(self._username, self._password)
+
     async def login(self, username: str, password: str) -> dict:
-        payload = await self._send({"command": "login", "user": username, "password": password, "long_life": False})
+        payload = await self._send({"command": "login", "user": username, "password": password, "long_life": True})
         token = payload.get("token") if isinstance(payload, dict) else None
-        self._token = token
+        self._set_token(token)
+        return payload
+
+    async def login_token(self, token: str) -> dict:
+        """Resume a session with a long-life token from an earlier login."""
+        payload = await self._send({"command": "login", "token": token, "long_life": True})
+        # The device may hand out a fresh token when resuming
+        new_token = payload.get("token") if isinstance(payload, dict) else None
+        if new_token:
+            self._set_token(new_token)
         return payload
 
     async def keep_alive(self) -> None:
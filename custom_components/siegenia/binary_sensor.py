@@ -1,10 +1,10 @@
 from __future__ import annotations
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from .const import DOMAIN, DATA_CLIENT, DATA_COORDINATOR
+from .entity import SiegeniaEntity
 from .device import build_device_info
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
@@ -13,7 +13,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coordinator = data[DATA_COORDINATOR]
     async_add_entities([SiegeniaOnlineBinarySensor(client, coordinator, entry)], True)
 
-class SiegeniaOnlineBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SiegeniaOnlineBinarySensor(SiegeniaEntity, BinarySensorEntity):
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     
@@ -38,14 +38,8 @@ class SiegeniaOnlineBinarySensor(CoordinatorEntity, BinarySensorEntity):
         
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
+        data = self.coordinator.data
+        return data.system_name if data else None
     
     @property
     def device_info(self):
@@ -53,9 +47,18 @@ class SiegeniaOnlineBinarySensor(CoordinatorEntity, BinarySensorEntity):
             self.coordinator.data, self._entry.entry_id, self._entry.data.get("host")
         )
 
+    @property
+    def available(self) -> bool:
+        # Reports the connection itself, so it stays available while offline
+        return True
+
     @property
     def is_on(self) -> bool:
         try:
             return bool(getattr(self._client, "connected", False))
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"connection_state": self._client.state.value}
\ No newline at end of file
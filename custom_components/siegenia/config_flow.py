@@ -5,12 +5,36 @@ from typing import Any, Dict
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_PORT, CONF_SSL
 
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_USE_SSL
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    DEFAULT_USE_SSL,
+    CONF_STATISTICS_WINDOWS,
+    DEFAULT_STATISTICS_WINDOWS,
+    CONF_IMPORT_STATISTICS,
+    CONF_DCV_ENABLED,
+    CONF_CO2_SETPOINT,
+    CONF_HUMIDITY_SETPOINT,
+    CONF_HYSTERESIS,
+    CONF_MIN_FANPOWER,
+    CONF_MAX_FANPOWER,
+    CONF_MAX_WRITES_PER_MINUTE,
+    DEFAULT_CO2_SETPOINT,
+    DEFAULT_HUMIDITY_SETPOINT,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_FANPOWER,
+    DEFAULT_MAX_FANPOWER,
+    DEFAULT_MAX_WRITES_PER_MINUTE,
+    CONF_EVENT_KEYS,
+    CONF_NOMINAL_EFFICIENCY,
+    DEFAULT_NOMINAL_EFFICIENCY,
+)
 from .api import SiegeniaClient
+from .window import format_windows, parse_windows
 
 DATA_SCHEMA = vol.Schema(
     {
@@ -25,6 +49,11 @@ DATA_SCHEMA = vol.Schema(
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(self, user_input: Dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
         if user_input is not None:
@@ -57,3 +86,60 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=f"Siegenia {host}", data=data)
 
         return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors=errors)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input: Dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                parse_windows(user_input.get(CONF_STATISTICS_WINDOWS, ""))
+            except ValueError:
+                errors[CONF_STATISTICS_WINDOWS] = "invalid_windows"
+            if user_input.get(CONF_MIN_FANPOWER, 0) > user_input.get(CONF_MAX_FANPOWER, 100):
+                errors[CONF_MAX_FANPOWER] = "invalid_fanpower_range"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_STATISTICS_WINDOWS,
+                    default=options.get(CONF_STATISTICS_WINDOWS, format_windows(DEFAULT_STATISTICS_WINDOWS)),
+                ): str,
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=options.get(CONF_IMPORT_STATISTICS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_NOMINAL_EFFICIENCY,
+                    default=options.get(CONF_NOMINAL_EFFICIENCY, DEFAULT_NOMINAL_EFFICIENCY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Optional(CONF_DCV_ENABLED, default=options.get(CONF_DCV_ENABLED, False)): bool,
+                vol.Optional(
+                    CONF_CO2_SETPOINT, default=options.get(CONF_CO2_SETPOINT, DEFAULT_CO2_SETPOINT)
+                ): vol.All(vol.Coerce(int), vol.Range(min=400, max=5000)),
+                vol.Optional(
+                    CONF_HUMIDITY_SETPOINT, default=options.get(CONF_HUMIDITY_SETPOINT, DEFAULT_HUMIDITY_SETPOINT)
+                ): vol.All(vol.Coerce(int), vol.Range(min=20, max=95)),
+                vol.Optional(
+                    CONF_HYSTERESIS, default=options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=50)),
+                vol.Optional(
+                    CONF_MIN_FANPOWER, default=options.get(CONF_MIN_FANPOWER, DEFAULT_MIN_FANPOWER)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_MAX_FANPOWER, default=options.get(CONF_MAX_FANPOWER, DEFAULT_MAX_FANPOWER)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_MAX_WRITES_PER_MINUTE,
+                    default=options.get(CONF_MAX_WRITES_PER_MINUTE, DEFAULT_MAX_WRITES_PER_MINUTE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Optional(CONF_EVENT_KEYS, default=options.get(CONF_EVENT_KEYS, "")): str,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
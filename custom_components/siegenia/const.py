@@ -10,9 +10,61 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_PORT = "port"
 CONF_USE_SSL = "use_ssl"
+CONF_TOKEN = "token"
 
 DATA_CLIENT = "client"
 DATA_COORDINATOR = "coordinator"
+DATA_OPTIONS = "options"
 
 UPDATE_INTERVAL_SECONDS = 10
 HEARTBEAT_SECONDS = 10
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+
+CONF_NOMINAL_EFFICIENCY = "nominal_efficiency"
+# Percent; used for heat-recovery power/energy when no supply air temperature is reported
+DEFAULT_NOMINAL_EFFICIENCY = 75
+
+CONF_STATISTICS_WINDOWS = "statistics_windows"
+# Rolling-window statistics per flattened key, window lengths in seconds
+DEFAULT_STATISTICS_WINDOWS = {
+    "co2_value": [300, 3600],
+    "airbase.humidity.indoor": [300, 3600],
+}
+
+CONF_IMPORT_STATISTICS = "import_statistics"
+STATISTICS_FLUSH_MINUTES = 5
+
+CONF_DCV_ENABLED = "dcv_enabled"
+CONF_CO2_SETPOINT = "co2_setpoint"
+CONF_HUMIDITY_SETPOINT = "humidity_setpoint"
+CONF_HYSTERESIS = "hysteresis"
+CONF_MIN_FANPOWER = "min_fanpower"
+CONF_MAX_FANPOWER = "max_fanpower"
+CONF_MAX_WRITES_PER_MINUTE = "max_writes_per_minute"
+DEFAULT_CO2_SETPOINT = 800
+DEFAULT_HUMIDITY_SETPOINT = 60
+DEFAULT_HYSTERESIS = 5
+DEFAULT_MIN_FANPOWER = 10
+DEFAULT_MAX_FANPOWER = 100
+DEFAULT_MAX_WRITES_PER_MINUTE = 2
+
+# params.fanmode values offered as fan preset modes; other values show up as "mode_<n>"
+FANMODE_PRESETS = {
+    0: "heat_recovery",
+    1: "supply",
+    2: "exhaust",
+}
+PRESET_AUTO = "auto"
+# fanmode values that only supply or only exhaust air, so no heat is recovered
+ONE_WAY_FANMODES = (1, 2)
+
+CONF_EVENT_KEYS = "event_keys"
+# Fired once per coordinator update with the flattened keys that changed
+EVENT_CHANGED = f"{DOMAIN}_changed"
+
+SERVICE_SET_GROUP = "set_group"
+ATTR_PARAMS = "params"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+DEFAULT_GROUP_CONCURRENCY = 4
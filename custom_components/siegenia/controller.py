@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_CO2_SETPOINT,
+    CONF_HUMIDITY_SETPOINT,
+    CONF_HYSTERESIS,
+    CONF_MIN_FANPOWER,
+    CONF_MAX_FANPOWER,
+    CONF_MAX_WRITES_PER_MINUTE,
+    DEFAULT_CO2_SETPOINT,
+    DEFAULT_HUMIDITY_SETPOINT,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_FANPOWER,
+    DEFAULT_MAX_FANPOWER,
+    DEFAULT_MAX_WRITES_PER_MINUTE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Demand rises from 0 at the setpoint to 1 this far above it
+CO2_BAND_PPM = 600.0
+HUMIDITY_BAND_PERCENT = 20.0
+# A written target is trusted over the reported value until the next polls catch up
+WRITE_SETTLE_SECONDS = 60.0
+
+CO2_KEYS = ("co2_value", "airquality.co2content")
+HUMIDITY_KEY = "airbase.humidity.indoor"
+
+
+def _demand(value: Optional[float], setpoint: float, band: float) -> float:
+    if value is None:
+        return 0.0
+    return max(0.0, min(1.0, (value - setpoint) / band))
+
+
+class VentilationController:
+    """Proportional CO2/humidity fan control with a deadband and a write budget."""
+
+    __slots__ = (
+        "co2_setpoint",
+        "humidity_setpoint",
+        "hysteresis",
+        "min_fanpower",
+        "max_fanpower",
+        "max_writes_per_minute",
+        "_writes",
+        "_last_target",
+        "_last_write_ts",
+    )
+
+    def __init__(
+        self,
+        co2_setpoint: float = DEFAULT_CO2_SETPOINT,
+        humidity_setpoint: float = DEFAULT_HUMIDITY_SETPOINT,
+        hysteresis: float = DEFAULT_HYSTERESIS,
+        min_fanpower: int = DEFAULT_MIN_FANPOWER,
+        max_fanpower: int = DEFAULT_MAX_FANPOWER,
+        max_writes_per_minute: int = DEFAULT_MAX_WRITES_PER_MINUTE,
+    ) -> None:
+        self.co2_setpoint = float(co2_setpoint)
+        self.humidity_setpoint = float(humidity_setpoint)
+        self.hysteresis = float(hysteresis)
+        self.min_fanpower = int(min_fanpower)
+        self.max_fanpower = max(self.min_fanpower, int(max_fanpower))
+        self.max_writes_per_minute = max(1, int(max_writes_per_minute))
+        self._writes: deque[float] = deque()
+        self._last_target: Optional[int] = None
+        self._last_write_ts = 0.0
+
+    def target(self, co2: Optional[float], humidity: Optional[float]) -> int:
+        demand = max(
+            _demand(co2, self.co2_setpoint, CO2_BAND_PPM),
+            _demand(humidity, self.humidity_setpoint, HUMIDITY_BAND_PERCENT),
+        )
+        return int(round(self.min_fanpower + demand * (self.max_fanpower - self.min_fanpower)))
+
+    def decide(self, now: float, co2: Optional[float], humidity: Optional[float], current: Optional[int]) -> Optional[int]:
+        """Return the fanpower to write, or None when no write is due.
+
+        Nothing is recorded here; call ``commit`` once the write succeeded so
+        failed writes neither use up the budget nor count as applied.
+        """
+        target = self.target(co2, humidity)
+        reference = current
+        if self._last_target is not None and now - self._last_write_ts < WRITE_SETTLE_SECONDS:
+            reference = self._last_target
+        if reference is not None:
+            if target == reference:
+                return None
+            at_limit = target in (self.min_fanpower, self.max_fanpower)
+            if abs(target - reference) <= self.hysteresis and not at_limit:
+                return None
+
+        while self._writes and now - self._writes[0] >= 60.0:
+            self._writes.popleft()
+        if len(self._writes) >= self.max_writes_per_minute:
+            return None
+        return target
+
+    def commit(self, now: float, target: int) -> None:
+        """Record a successful write of ``target``."""
+        self._writes.append(now)
+        self._last_target = target
+        self._last_write_ts = now
+
+    @classmethod
+    def from_options(cls, options) -> "VentilationController":
+        return cls(
+            co2_setpoint=options.get(CONF_CO2_SETPOINT, DEFAULT_CO2_SETPOINT),
+            humidity_setpoint=options.get(CONF_HUMIDITY_SETPOINT, DEFAULT_HUMIDITY_SETPOINT),
+            hysteresis=options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+            min_fanpower=options.get(CONF_MIN_FANPOWER, DEFAULT_MIN_FANPOWER),
+            max_fanpower=options.get(CONF_MAX_FANPOWER, DEFAULT_MAX_FANPOWER),
+            max_writes_per_minute=options.get(CONF_MAX_WRITES_PER_MINUTE, DEFAULT_MAX_WRITES_PER_MINUTE),
+        )
+
+
+def _float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def async_setup_controller(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+    """Run the controller on every coordinator update."""
+    controller = VentilationController.from_options(entry.options)
+    busy = False
+
+    async def _write(target: int) -> None:
+        nonlocal busy
+        try:
+            await coordinator.async_write_params(
+                coordinator.data.accepted({"automode": False, "fanpower": target})
+            )
+            controller.commit(time.monotonic(), target)
+            _LOGGER.debug("Ventilation control set fanpower to %s", target)
+        except Exception as exc:
+            _LOGGER.warning("Ventilation control write failed: %s", exc)
+        finally:
+            busy = False
+
+    @callback
+    def _update() -> None:
+        nonlocal busy
+        if busy or not coordinator.last_update_success:
+            return
+        flat = coordinator.data.flat
+        co2 = None
+        for key in CO2_KEYS:
+            co2 = _float(flat.get(key))
+            if co2 is not None:
+                break
+        humidity = _float(flat.get(HUMIDITY_KEY))
+        if co2 is None and humidity is None:
+            return
+        target = controller.decide(time.monotonic(), co2, humidity, coordinator.data.fanpower)
+        if target is None:
+            return
+        busy = True
+        entry.async_create_background_task(hass, _write(target), f"{entry.entry_id}-ventilation-control")
+
+    entry.async_on_unload(coordinator.async_add_listener(_update))
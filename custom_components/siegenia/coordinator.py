@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import SiegeniaClient
+from .const import CONF_EVENT_KEYS, DOMAIN, EVENT_CHANGED, UPDATE_INTERVAL_SECONDS
+from .model import DeviceData, _merge, diff_flat, key_filter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SiegeniaCoordinator(DataUpdateCoordinator[DeviceData]):
+    """Polls state, params and info and parses them into a DeviceData."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, client: SiegeniaClient) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name="siegenia",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+        )
+        self.client = client
+        self._event_match = key_filter(entry.options.get(CONF_EVENT_KEYS, ""))
+        self._last_flat: dict | None = None
+        self._device_id: str | None = None
+
+    async def _fetch(self) -> DeviceData:
+        client = self.client
+        if not client.connected:
+            await client.connect()
+        state = await client.get_device_state()
+        params = await client.get_device_params()
+        info = await client.get_device()
+        return DeviceData.parse(state, params, info)
+
+    async def _async_update_data(self) -> DeviceData:
+        try:
+            return await self._fetch()
+        except Exception as exc:
+            _LOGGER.debug("Update error, attempting reconnect: %s", exc)
+            await self.client.connect()
+            return await self._fetch()
+
+    async def async_write_params(self, params: dict) -> None:
+        """Write params and patch only the affected section of the data.
+
+        The acknowledgement is merged into params for the keys params already
+        holds; otherwise only the section holding the written keys is read
+        back, instead of a full state/params/info refresh. An empty frame
+        (none of the keys is reported by this firmware, see
+        ``DeviceData.accepted``) raises instead of being sent.
+        """
+        if not params:
+            raise HomeAssistantError("The device reports none of the parameters to write")
+        known = self.data
+        ack = await self.client.set_device_params(params)
+        # Ack keys outside params (e.g. an echoed devicestate) must not end up
+        # in params, where they would shadow the state section in DeviceData
+        echo = {k: v for k, v in ack.items() if k in known.params} if isinstance(ack, dict) else {}
+        param_keys = [k for k in params if k in known.params]
+        unknown = any(k not in known.params and k not in known.state for k in params)
+        params_read = state_read = None
+        if unknown or any(k not in echo for k in param_keys):
+            params_read = await self.client.get_device_params()
+        if any(k in known.state and k not in known.params for k in params):
+            state_read = await self.client.get_device_state()
+        # A poll or push refresh may have landed during the awaits; patch the
+        # current snapshot so only the sections read here replace its data
+        data = self.data
+        if params_read is not None:
+            current = params_read
+        elif echo:
+            current = _merge(data.params, echo)
+        else:
+            current = data.params
+        state = state_read if state_read is not None else data.state
+        self.async_set_updated_data(DeviceData.parse(state, current, data.info))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self._async_fire_changes()
+        super().async_update_listeners()
+
+    @callback
+    def _async_fire_changes(self) -> None:
+        """Fire one event with the keys that changed since the last snapshot."""
+        data = self.data
+        if data is None:
+            return
+        previous, self._last_flat = self._last_flat, data.flat
+        if previous is None or previous is data.flat:
+            return
+        changes = diff_flat(previous, data.flat, self._event_match)
+        if not changes:
+            return
+        if self._device_id is None:
+            device = dr.async_get(self.hass).async_get_device(identifiers={(DOMAIN, self.config_entry.entry_id)})
+            self._device_id = device.id if device else None
+        self.hass.bus.async_fire(
+            EVENT_CHANGED,
+            {"entry_id": self.config_entry.entry_id, "device_id": self._device_id, "changes": changes},
+        )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+# Volumetric heat capacity of air in Wh/(m³·K) (1.2 kg/m³ * 1005 J/(kg·K) / 3600)
+AIR_HEAT_CAPACITY_WH = 0.335
+# Default heat-exchanger efficiency assumed when no supply air temperature is reported
+NOMINAL_EFFICIENCY = 0.75
+# Below this indoor/outdoor difference the efficiency ratio is mostly sensor noise
+MIN_DELTA_K = 1.0
+# Gaps longer than this (outage, restart) are not integrated
+MAX_GAP_SECONDS = 300.0
+
+TEMP_INDOOR_KEY = "airbase.temperature.indoor"
+TEMP_OUTDOOR_KEY = "airbase.temperature.outdoor"
+TEMP_SUPPLY_KEYS = ("airbase.temperature.supply", "airbase.temperature.intake")
+
+
+def _float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class HeatRecoveryTracker:
+    """Incremental heat-recovery figures from temperatures and airflow.
+
+    Every update is O(1): the recovered energy and the time-weighted mean
+    efficiency are kept as running sums, so no history is ever needed.
+
+    ``efficiency`` is only set when it can be measured from a supply air
+    temperature. Otherwise power and energy are computed with
+    ``nominal_efficiency`` and ``estimated`` is True.
+    """
+
+    __slots__ = (
+        "nominal_efficiency",
+        "efficiency",
+        "estimated",
+        "power_w",
+        "energy_kwh",
+        "_eff_seconds",
+        "_eff_weighted",
+        "_last_ts",
+    )
+
+    def __init__(self, nominal_efficiency: float = NOMINAL_EFFICIENCY) -> None:
+        self.nominal_efficiency = nominal_efficiency
+        self.efficiency: Optional[float] = None
+        self.estimated = True
+        self.power_w: Optional[float] = None
+        self.energy_kwh: float = 0.0
+        self._eff_seconds: float = 0.0
+        self._eff_weighted: float = 0.0
+        self._last_ts: Optional[float] = None
+
+    @property
+    def mean_efficiency(self) -> Optional[float]:
+        if self._eff_seconds <= 0:
+            return None
+        return self._eff_weighted / self._eff_seconds
+
+    def update(self, ts: float, flat: dict, airflow_m3h: Optional[float]) -> None:
+        """Feed one snapshot; ``airflow_m3h`` is the air passing the exchanger (0 when none)."""
+        t_in = _float(flat.get(TEMP_INDOOR_KEY))
+        t_out = _float(flat.get(TEMP_OUTDOOR_KEY))
+        t_supply = None
+        for key in TEMP_SUPPLY_KEYS:
+            t_supply = _float(flat.get(key))
+            if t_supply is not None:
+                break
+
+        # Integrate the previous sample over the elapsed interval (left Riemann sum)
+        if self._last_ts is not None:
+            dt = ts - self._last_ts
+            if 0 < dt <= MAX_GAP_SECONDS:
+                if self.power_w is not None:
+                    self.energy_kwh += abs(self.power_w) * dt / 3_600_000
+                if self.efficiency is not None:
+                    self._eff_seconds += dt
+                    self._eff_weighted += self.efficiency * dt
+        self._last_ts = ts
+
+        if t_in is None or t_out is None or abs(t_in - t_out) < MIN_DELTA_K:
+            self.efficiency = None
+            self.estimated = False
+            self.power_w = 0.0 if t_in is not None and t_out is not None else None
+            return
+
+        # Unit off or not recovering: nothing is exchanged and the supply
+        # temperature says nothing about the exchanger
+        if airflow_m3h is not None and airflow_m3h <= 0:
+            self.efficiency = None
+            self.estimated = False
+            self.power_w = 0.0
+            return
+
+        if t_supply is not None:
+            eff = (t_supply - t_out) / (t_in - t_out)
+            self.efficiency = max(0.0, min(1.0, eff))
+            self.estimated = False
+        else:
+            self.efficiency = None
+            self.estimated = True
+
+        if airflow_m3h is None:
+            self.power_w = None
+            return
+        factor = self.nominal_efficiency if self.efficiency is None else self.efficiency
+        self.power_w = AIR_HEAT_CAPACITY_WH * airflow_m3h * factor * (t_in - t_out)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "energy_kwh": self.energy_kwh,
+            "eff_seconds": self._eff_seconds,
+            "eff_weighted": self._eff_weighted,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict | None, nominal_efficiency: float = NOMINAL_EFFICIENCY) -> "HeatRecoveryTracker":
+        tracker = cls(nominal_efficiency)
+        data = data or {}
+        tracker.energy_kwh = _float(data.get("energy_kwh")) or 0.0
+        tracker._eff_seconds = _float(data.get("eff_seconds")) or 0.0
+        tracker._eff_weighted = _float(data.get("eff_weighted")) or 0.0
+        return tracker
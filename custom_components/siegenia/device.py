@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from .const import DOMAIN
+from .model import DeviceData
 
 
-def _info_from_data(data: dict | None) -> dict:
-    info = (data or {}).get("info") or {}
-    return info if isinstance(info, dict) else {}
+def _info_from_data(data: DeviceData | None) -> dict:
+    return data.info if data is not None else {}
 
 
 def _coerce_str(value) -> str | None:
@@ -14,7 +14,7 @@ def _coerce_str(value) -> str | None:
     return str(value)
 
 
-def build_device_info(data: dict | None, entry_id: str, host: str | None = None) -> dict:
+def build_device_info(data: DeviceData | None, entry_id: str, host: str | None = None) -> dict:
     info = _info_from_data(data)
     serial_raw = info.get("serialnr") or info.get("serial_number")
     identifiers = {(DOMAIN, str(serial_raw))} if serial_raw else {(DOMAIN, entry_id)}
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import ConnectionState
+from .coordinator import SiegeniaCoordinator
+
+
+class SiegeniaEntity(CoordinatorEntity[SiegeniaCoordinator]):
+    """Coordinator entity that also follows the client's socket state.
+
+    Connection transitions are pushed by the client, so availability changes
+    are written immediately instead of on the next coordinator update.
+    """
+
+    @property
+    def available(self) -> bool:
+        return super().available and self.coordinator.client.connected
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.client.add_state_listener(self._handle_connection_state)
+        )
+
+    @callback
+    def _handle_connection_state(self, state: ConnectionState) -> None:
+        self.async_write_ha_state()
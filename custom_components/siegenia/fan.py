@@ -1,4 +1,3 @@
-
 from __future__ import annotations
 
 import logging
@@ -6,15 +5,37 @@ from typing import Any, Optional
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, DATA_CLIENT, DATA_COORDINATOR
+from .const import DOMAIN, DATA_CLIENT, DATA_COORDINATOR, FANMODE_PRESETS, PRESET_AUTO
+from .entity import SiegeniaEntity
+from .model import DeviceData
 
 _LOGGER = logging.getLogger(__name__)
 
 PERCENTAGE_FLAG = getattr(FanEntityFeature, "SET_PERCENTAGE", getattr(FanEntityFeature, "SET_SPEED", 0))
-DEFAULT_MAX_M3H = 60
+# Used by turn_on when the firmware reports no power key to switch
+DEFAULT_ON_PERCENTAGE = 50
+
+
+def _preset_name(fanmode: Any) -> str:
+    try:
+        value = int(fanmode)
+    except (TypeError, ValueError):
+        return f"mode_{fanmode}"
+    return FANMODE_PRESETS.get(value, f"mode_{value}")
+
+
+def _preset_value(preset_mode: str) -> Optional[int]:
+    for value, name in FANMODE_PRESETS.items():
+        if name == preset_mode:
+            return value
+    if preset_mode.startswith("mode_"):
+        try:
+            return int(preset_mode[5:])
+        except ValueError:
+            return None
+    return None
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
@@ -23,7 +44,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([SiegeniaFanEntity(client, coordinator, entry)], True)
 
 
-class SiegeniaFanEntity(CoordinatorEntity, FanEntity):
+class SiegeniaFanEntity(SiegeniaEntity, FanEntity):
     _attr_has_entity_name = True
 
     def __init__(self, client, coordinator, entry: ConfigEntry) -> None:
@@ -37,124 +58,96 @@ class SiegeniaFanEntity(CoordinatorEntity, FanEntity):
         
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
-
-    def _combined(self) -> dict:
-        data = self.coordinator.data or {}
-        merged: dict[str, Any] = {}
-        for part in ("state", "params", "info"):
-            v = data.get(part) or {}
-            if isinstance(v, dict):
-                merged.update(v)
-        return merged
-
-    def _raw_max_m3h(self, d: dict) -> int:
-        for k in ("maxfanpower", "max_fan_power"):
-            if k in d:
-                try:
-                    val = int(d.get(k) or 0)
-                    if val > 0:
-                        return val
-                except Exception:
-                    continue
-        return DEFAULT_MAX_M3H
-
-    def _manual_cap_m3h(self, d: dict, raw_max: int) -> Optional[int]:
-        for k in ("maxfanpowermanual", "manual_maxfanpower"):
-            if k in d and d.get(k) is not None:
-                try:
-                    val = int(d.get(k))
-                    if val <= 0:
-                        continue
-                    # Heuristic: <=100 => treat as percent cap; >100 => absolute m³/h
-                    if val <= 100:
-                        return max(1, int(round(raw_max * val / 100)))
-                    return val
-                except Exception:
-                    continue
-        return None
-
-    def _effective_max_m3h(self, d: dict) -> int:
-        raw_max = self._raw_max_m3h(d)
-        cap = self._manual_cap_m3h(d, raw_max)
-        if cap is not None:
-            return min(raw_max, cap)
-        return raw_max
+        data = self.coordinator.data
+        return data.system_name if data else None
+
+    @property
+    def _data(self) -> Optional[DeviceData]:
+        return self.coordinator.data
 
     @property
     def is_on(self) -> bool:
-        d = self._combined()
-        for k in ("power", "on", "enabled"):
-            if k in d:
-                return bool(d.get(k))
-        try:
-            p = int(d.get("fanpower", 0) or 0)  # percent
-            return p > 0
-        except Exception:
-            return False
+        data = self._data
+        return data.is_on if data else False
 
     @property
     def percentage(self) -> int | None:
-        d = self._combined()
-        try:
-            p = int(d.get("fanpower", 0) or 0)  # Siegenia reports percent 0..100
-        except Exception:
-            p = 0
-        return max(0, min(100, p))
+        data = self._data
+        return data.fanpower if data else 0
 
     @property
     def supported_features(self) -> int:
-        return PERCENTAGE_FLAG | FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+        return (
+            PERCENTAGE_FLAG
+            | FanEntityFeature.TURN_ON
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.PRESET_MODE
+        )
+
+    @property
+    def preset_modes(self) -> list[str]:
+        modes = [PRESET_AUTO, *FANMODE_PRESETS.values()]
+        current = self.preset_mode
+        if current and current not in modes:
+            modes.append(current)
+        return modes
+
+    @property
+    def preset_mode(self) -> str | None:
+        data = self._data
+        if data is None:
+            return None
+        if data.automode:
+            return PRESET_AUTO
+        if data.fanmode is None:
+            return None
+        return _preset_name(data.fanmode)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        d = self._combined()
-        raw_max = self._raw_max_m3h(d)
-        eff_max = self._effective_max_m3h(d)
-        try:
-            p = int(d.get("fanpower", 0) or 0)
-        except Exception:
-            p = 0
-        airflow = round(eff_max * p / 100) if eff_max else None
-        manual_cap_field = None
-        for k in ("maxfanpowermanual", "manual_maxfanpower"):
-            if k in d:
-                manual_cap_field = d.get(k)
-                break
+        data = self._data
+        if data is None:
+            return {}
         return {
-            "fanmode": d.get("fanmode"),
-            "fanpower_percent": p,
-            "raw_maxfanpower_m3h": raw_max,
-            "manual_cap_reported": manual_cap_field,
-            "effective_maxfanpower_m3h": eff_max,
-            "airflow_m3h": airflow,
-            "systemname": d.get("systemname") or d.get("device_name"),
+            "fanmode": data.fanmode,
+            "fanpower_percent": data.fanpower,
+            "raw_maxfanpower_m3h": data.raw_max_m3h,
+            "manual_cap_reported": data.manual_cap_reported,
+            "effective_maxfanpower_m3h": data.effective_max_m3h,
+            "airflow_m3h": data.airflow_m3h,
+            "systemname": data.system_name,
         }
 
+    async def _async_write(self, values: dict[str, Any]) -> None:
+        """Send one frame with only the keys this firmware accepts."""
+        await self.coordinator.async_write_params(self.coordinator.data.accepted(values))
+
     async def async_set_percentage(self, percentage: int) -> None:
         target_pct = max(0, min(100, int(percentage or 0)))
-        params: dict[str, Any] = {
-            "automode": False,
-            "auto_mode": False,
-            "fanpower": target_pct,
-        }
-        await self._client.set_device_params(params)
-        await self.coordinator.async_request_refresh()
+        await self._async_write({"automode": False, "fanpower": target_pct})
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        if "percentage" in kwargs:
-            await self.async_set_percentage(kwargs["percentage"])
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        if preset_mode == PRESET_AUTO:
+            await self._async_write({"automode": True})
+            return
+        value = _preset_value(preset_mode)
+        if value is None:
+            raise ValueError(f"Unknown preset mode: {preset_mode}")
+        await self._async_write({"automode": False, "fanmode": value})
+
+    async def async_turn_on(
+        self, percentage: int | None = None, preset_mode: str | None = None, **kwargs: Any
+    ) -> None:
+        if preset_mode is not None:
+            await self.async_set_preset_mode(preset_mode)
+            return
+        if percentage is not None:
+            await self.async_set_percentage(percentage)
             return
-        await self._client.set_device_params({"power": True, "on": True, "enabled": True})
-        await self.coordinator.async_request_refresh()
+        values: dict[str, Any] = {"power": True}
+        if not self.coordinator.data.accepted(values):
+            values = {"automode": False, "fanpower": DEFAULT_ON_PERCENTAGE}
+        await self._async_write(values)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._client.set_device_params({"power": False, "on": False, "enabled": False, "fanpower": 0})
-        await self.coordinator.async_request_refresh()
+        await self._async_write({"power": False, "fanpower": 0})
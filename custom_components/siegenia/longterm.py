@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_SAVE_DELAY, STATISTICS_FLUSH_MINUTES
+
+_LOGGER = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 3600
+
+
+class BucketAccumulator:
+    """Mean/min/max of one key within one bucket."""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self, count: int = 0, total: float = 0.0, minimum: float = 0.0, maximum: float = 0.0) -> None:
+        self.count = count
+        self.total = total
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def add(self, value: float) -> None:
+        if self.count == 0:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+
+class StatisticsDownsampler:
+    """Per-key hourly buckets built in memory and handed out once complete."""
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self) -> None:
+        # key -> bucket start (epoch seconds) -> accumulator
+        self._buckets: dict[str, dict[int, BucketAccumulator]] = {}
+
+    def add(self, ts: float, values: dict[str, Any]) -> None:
+        start = int(ts // BUCKET_SECONDS * BUCKET_SECONDS)
+        for key, raw in values.items():
+            try:
+                value = float(raw)
+            except (TypeError, ValueError):
+                continue
+            per_key = self._buckets.setdefault(key, {})
+            acc = per_key.get(start)
+            if acc is None:
+                acc = per_key[start] = BucketAccumulator()
+            acc.add(value)
+
+    def pop_completed(self, now: float) -> dict[str, list[tuple[int, BucketAccumulator]]]:
+        current = int(now // BUCKET_SECONDS * BUCKET_SECONDS)
+        done: dict[str, list[tuple[int, BucketAccumulator]]] = {}
+        for key, per_key in self._buckets.items():
+            for start in sorted(s for s in per_key if s < current):
+                done.setdefault(key, []).append((start, per_key.pop(start)))
+        return done
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            key: {str(start): [a.count, a.total, a.minimum, a.maximum] for start, a in per_key.items()}
+            for key, per_key in self._buckets.items()
+            if per_key
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "StatisticsDownsampler":
+        sampler = cls()
+        for key, per_key in (data or {}).items():
+            try:
+                sampler._buckets[key] = {int(start): BucketAccumulator(*vals) for start, vals in per_key.items()}
+            except (TypeError, ValueError):
+                _LOGGER.debug("Dropping unreadable statistics buckets for %s", key)
+        return sampler
+
+
+def statistic_id(entry_id: str, key: str) -> str:
+    return f"{DOMAIN}:{re.sub(r'[^a-z0-9_]+', '_', f'{entry_id}_{key}'.lower())}"
+
+
+async def async_setup_statistics_import(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator,
+    units: dict[str, Optional[str]],
+) -> None:
+    """Downsample ``units`` keys locally and import them as external statistics."""
+    # Imported lazily: the recorder is only an after-dependency
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics")
+    sampler = StatisticsDownsampler.from_dict(await store.async_load())
+    title = entry.title or DOMAIN
+
+    @callback
+    def _update() -> None:
+        flat = coordinator.data.flat
+        sampler.add(dt_util.utcnow().timestamp(), {k: flat[k] for k in units if k in flat})
+        store.async_delay_save(sampler.as_dict, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _flush(_now: datetime | None = None) -> None:
+        completed = sampler.pop_completed(dt_util.utcnow().timestamp())
+        if not completed:
+            return
+        for key, buckets in completed.items():
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{title} {key}",
+                source=DOMAIN,
+                statistic_id=statistic_id(entry.entry_id, key),
+                unit_of_measurement=units.get(key),
+            )
+            stats = [
+                StatisticData(
+                    start=datetime.fromtimestamp(start, tz=timezone.utc),
+                    mean=acc.mean,
+                    min=acc.minimum,
+                    max=acc.maximum,
+                )
+                for start, acc in buckets
+            ]
+            async_add_external_statistics(hass, metadata, stats)
+        _LOGGER.debug("Imported %d hourly statistics series", len(completed))
+        store.async_delay_save(sampler.as_dict, STORAGE_SAVE_DELAY)
+
+    entry.async_on_unload(coordinator.async_add_listener(_update))
+    entry.async_on_unload(
+        async_track_time_interval(hass, _flush, timedelta(minutes=STATISTICS_FLUSH_MINUTES))
+    )
+    _flush()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import re
+from fnmatch import translate
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_M3H = 60
+
+# Canonical name -> keys the firmware variants report, in order of preference
+ALIASES: dict[str, tuple[str, ...]] = {
+    "automode": ("automode", "auto_mode"),
+    "deviceactive": ("deviceactive", "device_active", "devicestate.deviceactive"),
+    "maxfanpower": ("maxfanpower", "max_fan_power"),
+    "maxfanpowermanual": ("maxfanpowermanual", "manual_maxfanpower"),
+    "power": ("power", "on", "enabled"),
+    "systemname": ("systemname", "device_name"),
+}
+
+
+def _flatten(data: Dict[str, Any], parent: str = "", out: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    if out is None:
+        out = {}
+    for k, v in (data or {}).items():
+        key = f"{parent}.{k}" if parent else str(k)
+        if isinstance(v, dict):
+            _flatten(v, key, out)
+        else:
+            out[key] = v
+    return out
+
+
+def _merge(base: dict, patch: dict) -> dict:
+    """Return ``base`` with ``patch`` applied recursively; inputs are not modified."""
+    out = dict(base)
+    for k, v in patch.items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = _merge(out[k], v)
+        else:
+            out[k] = v
+    return out
+
+
+def _set_path(out: dict, key: str, value: Any) -> None:
+    *parents, leaf = key.split(".")
+    for part in parents:
+        out = out.setdefault(part, {})
+    out[leaf] = value
+
+
+def key_filter(text: str) -> Optional[Callable[[str], bool]]:
+    """Compile ``co2_value, airbase.*`` into a matcher; ``None`` matches every key."""
+    patterns = [p.strip() for p in (text or "").replace(";", ",").split(",") if p.strip()]
+    if not patterns:
+        return None
+    exact = {p for p in patterns if not any(c in p for c in "*?[")}
+    globs = [translate(p) for p in patterns if p not in exact]
+    if not globs:
+        return exact.__contains__
+    regex = re.compile("|".join(globs))
+    return lambda key: key in exact or regex.match(key) is not None
+
+
+def diff_flat(
+    old: dict[str, Any], new: dict[str, Any], match: Optional[Callable[[str], bool]] = None
+) -> dict[str, dict[str, Any]]:
+    """Changed leaf keys between two ``DeviceData.flat`` snapshots as ``{key: {old, new}}``."""
+    changes: dict[str, dict[str, Any]] = {}
+    for key, value in new.items():
+        if isinstance(value, dict) or (match is not None and not match(key)):
+            continue
+        previous = old.get(key)
+        if previous != value or key not in old:
+            changes[key] = {"old": previous, "new": value}
+    for key, previous in old.items():
+        if key in new or isinstance(previous, dict) or (match is not None and not match(key)):
+            continue
+        changes[key] = {"old": previous, "new": None}
+    return changes
+
+
+def _first(d: dict, canonical: str) -> tuple[Optional[str], Any]:
+    for key in ALIASES[canonical]:
+        if key in d:
+            return key, d[key]
+    return None, None
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _raw_max_m3h(d: dict) -> int:
+    for k in ALIASES["maxfanpower"]:
+        val = _int(d.get(k))
+        if val and val > 0:
+            return val
+    return DEFAULT_MAX_M3H
+
+
+def _manual_cap_m3h(d: dict, raw_max: int) -> Optional[int]:
+    for k in ALIASES["maxfanpowermanual"]:
+        val = _int(d.get(k))
+        if val is None or val <= 0:
+            continue
+        # Heuristic: <=100 => treat as percent cap; >100 => absolute m³/h
+        if val <= 100:
+            return max(1, int(round(raw_max * val / 100)))
+        return val
+    return None
+
+
+class DeviceData:
+    """One coordinator snapshot, parsed once per update.
+
+    The raw ``state``/``params``/``info`` payloads are kept for key-based
+    sensors; everything the platforms read is resolved here, including the
+    key aliases different firmware versions use.
+    """
+
+    __slots__ = (
+        "state",
+        "params",
+        "info",
+        "flat",
+        "fanpower",
+        "fanmode",
+        "automode",
+        "deviceactive",
+        "power",
+        "raw_max_m3h",
+        "manual_cap_reported",
+        "effective_max_m3h",
+        "system_name",
+    )
+
+    def __init__(self, state: dict, params: dict, info: dict) -> None:
+        self.state = state
+        self.params = params
+        self.info = info
+
+        combined: dict[str, Any] = {}
+        for part in (state, params, info):
+            combined.update(part)
+        flat = dict(combined)
+        flat.update(_flatten(combined))
+        self.flat = flat
+
+        fanpower = _int(combined.get("fanpower") or 0) or 0
+        self.fanpower = max(0, min(100, fanpower))
+        self.fanmode = combined.get("fanmode")
+        self.automode = bool(_first(combined, "automode")[1] or False)
+        self.deviceactive = bool(_first(flat, "deviceactive")[1] or False)
+        power_key, power = _first(combined, "power")
+        self.power: Optional[bool] = bool(power) if power_key else None
+        self.raw_max_m3h = _raw_max_m3h(combined)
+        self.manual_cap_reported = _first(combined, "maxfanpowermanual")[1]
+        cap = _manual_cap_m3h(combined, self.raw_max_m3h)
+        self.effective_max_m3h = min(self.raw_max_m3h, cap) if cap is not None else self.raw_max_m3h
+        self.system_name: Optional[str] = None
+        for part in (state, params, info):
+            name = part.get("systemname") or part.get("device_name")
+            if name:
+                self.system_name = name
+                break
+
+    @classmethod
+    def parse(cls, state: Any, params: Any, info: Any) -> "DeviceData":
+        return cls(
+            state if isinstance(state, dict) else {},
+            params if isinstance(params, dict) else {},
+            info if isinstance(info, dict) else {},
+        )
+
+    def accepted(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Build a setDeviceParams frame from canonical keys.
+
+        Each key is written under the name this firmware reports it, looked up
+        in the params payload first and then in the state payload (so no alias
+        duplicates are sent); keys it reports in neither are dropped.
+        """
+        sources = []
+        for part in (self.params, self.state):
+            keys = _flatten(part)
+            keys.update(part)
+            sources.append(keys)
+        out: dict[str, Any] = {}
+        for canonical, value in values.items():
+            names = ALIASES.get(canonical, (canonical,))
+            for keys in sources:
+                key = next((k for k in names if k in keys), None)
+                if key is not None:
+                    _set_path(out, key, value)
+                    break
+        return out
+
+    @property
+    def is_on(self) -> bool:
+        if self.power is not None:
+            return self.power
+        return self.fanpower > 0
+
+    @property
+    def airflow_m3h(self) -> int:
+        return round(self.effective_max_m3h * self.fanpower / 100)
@@ -1,63 +1,21 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from homeassistant.components.number import NumberEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
 from .const import DOMAIN, DATA_CLIENT, DATA_COORDINATOR
-
-def _combined(data: dict | None) -> dict:
-    data = data or {}
-    merged = {}
-    for key in ("state", "params", "info"):
-        v = data.get(key) or {}
-        if isinstance(v, dict):
-            merged.update(v)
-    return merged
-
-def _raw_max_m3h(d: dict) -> int:
-    for k in ("maxfanpower", "max_fan_power"):
-        if k in d and d.get(k):
-            try:
-                v = int(d.get(k))
-                if v > 0:
-                    return v
-            except Exception:
-                continue
-    return 60
-
-def _manual_cap_m3h(d: dict, raw_max: int) -> Optional[int]:
-    for k in ("maxfanpowermanual", "manual_maxfanpower"):
-        if k in d and d.get(k) is not None:
-            try:
-                val = int(d.get(k))
-                if val <= 0:
-                    continue
-                if val <= 100:
-                    return max(1, int(round(raw_max * val / 100)))
-                return val
-            except Exception:
-                continue
-    return None
-
-def _effective_max_m3h(d: dict) -> int:
-    raw_max = _raw_max_m3h(d)
-    cap = _manual_cap_m3h(d, raw_max)
-    if cap is not None:
-        return min(raw_max, cap)
-    return raw_max
+from .entity import SiegeniaEntity
+from .model import ALIASES
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     coord = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    d = _combined(coord.data)
-    if any(k in d for k in ("fanpower", "maxfanpower", "maxfanpowermanual", "max_fan_power", "manual_maxfanpower")):
+    flat = coord.data.flat
+    if any(k in flat for k in ("fanpower", *ALIASES["maxfanpower"], *ALIASES["maxfanpowermanual"])):
         async_add_entities([SiegeniaFanPowerNumber(hass, entry)], True)
 
-class SiegeniaFanPowerNumber(CoordinatorEntity, NumberEntity):
+class SiegeniaFanPowerNumber(SiegeniaEntity, NumberEntity):
     _attr_icon = "mdi:fan"
     _attr_native_unit_of_measurement = "m³/h"
     _attr_mode = "auto"
@@ -74,17 +32,8 @@ class SiegeniaFanPowerNumber(CoordinatorEntity, NumberEntity):
         
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
-
-    def _d(self) -> dict:
-        return _combined(self.coordinator.data)
+        data = self.coordinator.data
+        return data.system_name if data else None
 
     @property
     def native_min_value(self) -> float:
@@ -92,7 +41,7 @@ class SiegeniaFanPowerNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_max_value(self) -> float:
-        return float(_effective_max_m3h(self._d()))
+        return float(self.coordinator.data.effective_max_m3h)
 
     @property
     def native_step(self) -> float:
@@ -100,18 +49,13 @@ class SiegeniaFanPowerNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        d = self._d()
-        try:
-            pct = int(d.get("fanpower", 0) or 0)  # percent 0..100
-        except Exception:
-            pct = 0
-        eff_max = _effective_max_m3h(d)
-        return round(eff_max * pct / 100, 0)
+        data = self.coordinator.data
+        return float(data.airflow_m3h) if data else None
 
     async def async_set_native_value(self, value: float) -> None:
-        d = self._d()
-        eff_max = _effective_max_m3h(d)
+        eff_max = self.coordinator.data.effective_max_m3h
         value = max(0.0, min(float(value), float(eff_max)))
         pct = int(round((value * 100) / max(1.0, float(eff_max))))
-        await self._client.set_device_params({"automode": False, "auto_mode": False, "fanpower": pct})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_params(
+            self.coordinator.data.accepted({"automode": False, "fanpower": pct})
+        )
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DATA_COORDINATOR
+from .const import (
+    DOMAIN,
+    DATA_COORDINATOR,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    UPDATE_INTERVAL_SECONDS,
+    CONF_STATISTICS_WINDOWS,
+    DEFAULT_STATISTICS_WINDOWS,
+    CONF_IMPORT_STATISTICS,
+    CONF_NOMINAL_EFFICIENCY,
+    DEFAULT_NOMINAL_EFFICIENCY,
+    ONE_WAY_FANMODES,
+)
 from .device import build_device_info
+from .derived import HeatRecoveryTracker, TEMP_INDOOR_KEY, TEMP_OUTDOOR_KEY, TEMP_SUPPLY_KEYS
+from .entity import SiegeniaEntity
+from .longterm import async_setup_statistics_import
+from .model import ALIASES, DeviceData
+from .window import RollingWindow, parse_windows, window_label
+
+WINDOW_STATS = ("mean", "min", "max", "trend")
 
 UNIT_MAP = {
     "airbase.humidity.indoor": "%",
@@ -26,37 +46,110 @@ UNIT_MAP = {
     "maxfanpowermanual": None,
 }
 
-def _flatten(data: Dict[str, Any], parent: str = "", out: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    if out is None:
-        out = {}
-    for k, v in (data or {}).items():
-        key = f"{parent}.{k}" if parent else str(k)
-        if isinstance(v, dict):
-            _flatten(v, key, out)
-        else:
-            out[key] = v
-    return out
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data[DATA_COORDINATOR]
 
-    combined = {}
-    for part in ("state", "params", "info"):
-        d = (coordinator.data or {}).get(part) or {}
-        if isinstance(d, dict):
-            combined.update(d)
-    flat = _flatten(combined)
-    flat.update(combined)
+    flat = coordinator.data.flat
 
-    entities: list[SensorEntity] = []
-    for key, unit in UNIT_MAP.items():
-        if key in flat:
-            entities.append(SiegeniaKeySensor(coordinator, entry, key, unit))
+    entities: list[SensorEntity] = list(_key_sensors(coordinator, entry))
+
+    if TEMP_INDOOR_KEY in flat and TEMP_OUTDOOR_KEY in flat:
+        entities.extend(await _async_setup_heat_recovery(hass, entry, coordinator))
+
+    entities.extend(_setup_windows(entry, coordinator, flat))
+
+    if entry.options.get(CONF_IMPORT_STATISTICS) and "recorder" in hass.config.components:
+        units = {
+            key: unit
+            for key, unit in UNIT_MAP.items()
+            if isinstance(flat.get(key), (int, float)) and not isinstance(flat.get(key), bool)
+        }
+        await async_setup_statistics_import(hass, entry, coordinator, units)
 
     async_add_entities(entities)
 
-class SiegeniaKeySensor(CoordinatorEntity, SensorEntity):
+def _key_sensors(coordinator, entry: ConfigEntry) -> list[SensorEntity]:
+    flat = coordinator.data.flat
+    return [SiegeniaKeySensor(coordinator, entry, key, unit) for key, unit in UNIT_MAP.items() if key in flat]
+
+def _setup_windows(entry: ConfigEntry, coordinator, flat: dict) -> list[SensorEntity]:
+    try:
+        spec = parse_windows(entry.options[CONF_STATISTICS_WINDOWS])
+    except (KeyError, ValueError):
+        spec = DEFAULT_STATISTICS_WINDOWS
+
+    windows: dict[str, list[RollingWindow]] = {}
+    entities: list[SensorEntity] = []
+    for key, seconds in spec.items():
+        if key not in flat:
+            continue
+        unit = UNIT_MAP.get(key)
+        for window in seconds:
+            ring = RollingWindow.for_interval(window, UPDATE_INTERVAL_SECONDS)
+            windows.setdefault(key, []).append(ring)
+            for stat in WINDOW_STATS:
+                entities.append(SiegeniaWindowSensor(coordinator, entry, key, unit, ring, stat))
+    if not windows:
+        return entities
+
+    @callback
+    def _update() -> None:
+        values = coordinator.data.flat
+        now = dt_util.utcnow().timestamp()
+        for key, rings in windows.items():
+            try:
+                value = float(values[key])
+            except (KeyError, TypeError, ValueError):
+                for ring in rings:
+                    ring.evict(now)
+                continue
+            for ring in rings:
+                ring.push(now, value)
+
+    entry.async_on_unload(coordinator.async_add_listener(_update))
+    _update()
+    return entities
+
+def _recovery_airflow(data: DeviceData) -> float:
+    """Airflow through the exchanger: 0 when the unit is off or in a one-way mode."""
+    if not data.is_on:
+        return 0.0
+    if not data.deviceactive and any(k in data.flat for k in ALIASES["deviceactive"]):
+        return 0.0
+    try:
+        fanmode = int(data.fanmode) if data.fanmode is not None else None
+    except (TypeError, ValueError):
+        fanmode = None
+    if fanmode in ONE_WAY_FANMODES:
+        return 0.0
+    return data.effective_max_m3h * data.fanpower / 100
+
+async def _async_setup_heat_recovery(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> list[SensorEntity]:
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.heat_recovery")
+    nominal = entry.options.get(CONF_NOMINAL_EFFICIENCY, DEFAULT_NOMINAL_EFFICIENCY) / 100
+    tracker = HeatRecoveryTracker.from_dict(await store.async_load(), nominal)
+
+    @callback
+    def _update() -> None:
+        data = coordinator.data
+        tracker.update(dt_util.utcnow().timestamp(), data.flat, _recovery_airflow(data))
+        store.async_delay_save(tracker.as_dict, STORAGE_SAVE_DELAY)
+
+    # Registered before the entities so they always read the fresh figures
+    entry.async_on_unload(coordinator.async_add_listener(_update))
+    _update()
+
+    entities: list[SensorEntity] = [
+        SiegeniaHeatRecoverySensor(coordinator, entry, tracker, "heat_recovery.power"),
+        SiegeniaHeatRecoverySensor(coordinator, entry, tracker, "heat_recovery.energy"),
+    ]
+    # Efficiency can only be measured with a supply air temperature
+    if any(key in coordinator.data.flat for key in TEMP_SUPPLY_KEYS):
+        entities.append(SiegeniaHeatRecoverySensor(coordinator, entry, tracker, "heat_recovery.efficiency"))
+    return entities
+
+class SiegeniaKeySensor(SiegeniaEntity, SensorEntity):
     def __init__(self, coordinator, entry: ConfigEntry, key: str, unit: str | None) -> None:
         super().__init__(coordinator)
         self._entry = entry
@@ -83,33 +176,75 @@ class SiegeniaKeySensor(CoordinatorEntity, SensorEntity):
             
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
+        data = self.coordinator.data
+        return data.system_name if data else None
 
     @property
     def native_value(self) -> Any:
-        data = self.coordinator.data or {}
-        combined = {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                combined.update(d)
-        flat = combined.copy()
-        def _flatten_in(x: dict, parent: str = "", out: dict | None = None):
-            if out is None:
-                out = {}
-            for k, v in (x or {}).items():
-                kk = f"{parent}.{k}" if parent else str(k)
-                if isinstance(v, dict):
-                    _flatten_in(v, kk, out)
-                else:
-                    out[kk] = v
-            return out
-        flat.update(_flatten_in(combined))
-        return flat.get(self._key)
+        data = self.coordinator.data
+        return data.flat.get(self._key) if data else None
+
+class SiegeniaHeatRecoverySensor(SiegeniaKeySensor):
+    """Heat-recovery figure derived from a shared HeatRecoveryTracker."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry: ConfigEntry, tracker: HeatRecoveryTracker, key: str) -> None:
+        unit = {"heat_recovery.efficiency": "%", "heat_recovery.power": "W", "heat_recovery.energy": "kWh"}[key]
+        super().__init__(coordinator, entry, key, unit)
+        self._tracker = tracker
+        if key == "heat_recovery.power":
+            self._attr_device_class = SensorDeviceClass.POWER
+        elif key == "heat_recovery.energy":
+            self._attr_device_class = SensorDeviceClass.ENERGY
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> Any:
+        t = self._tracker
+        if self._key == "heat_recovery.efficiency":
+            return None if t.efficiency is None else round(t.efficiency * 100, 1)
+        if self._key == "heat_recovery.power":
+            return None if t.power_w is None else round(t.power_w, 1)
+        return round(t.energy_kwh, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        t = self._tracker
+        if self._key == "heat_recovery.efficiency":
+            mean = t.mean_efficiency
+            return {"mean_efficiency_percent": None if mean is None else round(mean * 100, 1)}
+        return {
+            "estimated": t.estimated,
+            "nominal_efficiency_percent": round(t.nominal_efficiency * 100, 1),
+        }
+
+class SiegeniaWindowSensor(SiegeniaKeySensor):
+    """Mean/min/max/trend of a key over a RollingWindow fed by coordinator updates."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry: ConfigEntry, source_key: str, unit: str | None, ring: RollingWindow, stat: str) -> None:
+        key = f"{source_key}.{stat}_{window_label(int(ring.window))}"
+        if stat == "trend":
+            unit = f"{unit}/h" if unit else None
+        super().__init__(coordinator, entry, key, unit)
+        self._ring = ring
+        self._stat = stat
+
+    @property
+    def native_value(self) -> Any:
+        ring = self._ring
+        if self._stat == "mean":
+            value = ring.mean
+        elif self._stat == "min":
+            value = ring.minimum
+        elif self._stat == "max":
+            value = ring.maximum
+        else:
+            value = ring.trend
+        return None if value is None else round(value, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {"window_seconds": int(self._ring.window), "samples": len(self._ring)}
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import (
+    ATTR_MAX_CONCURRENCY,
+    ATTR_PARAMS,
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DEFAULT_GROUP_CONCURRENCY,
+    DOMAIN,
+    SERVICE_SET_GROUP,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# entity_id, device_id, area_id, floor_id, label_id, ... as accepted by the schema
+TARGET_KEYS = tuple(str(key) for key in cv.ENTITY_SERVICE_FIELDS)
+
+SET_GROUP_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_PARAMS): vol.All(dict, vol.Length(min=1)),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=DEFAULT_GROUP_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+    }
+)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+async def _async_set_group(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Write the same params to every targeted device, then refresh each once.
+
+    Writes go straight to the clients (bounded by ``max_concurrency``) so the
+    per-write read-back of the coordinator is skipped; one refresh per device
+    at the end picks up the result.
+    """
+    loaded: dict[str, dict] = hass.data.get(DOMAIN, {})
+    # Only a call without any target key means "all"; an explicit target that
+    # resolves to nothing raises below and is never widened to the fleet
+    if any(key in call.data for key in TARGET_KEYS):
+        entry_ids = await async_extract_config_entry_ids(hass, call)
+        targets = {eid: loaded[eid] for eid in entry_ids if eid in loaded}
+    else:
+        targets = dict(loaded)
+    if not targets:
+        raise HomeAssistantError("No loaded Siegenia device matches the target")
+
+    params: dict[str, Any] = call.data[ATTR_PARAMS]
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+    registry = dr.async_get(hass)
+    started = time.monotonic()
+
+    async def _write(entry_id: str, data: dict) -> dict[str, Any]:
+        coordinator = data[DATA_COORDINATOR]
+        device = registry.async_get_device(identifiers={(DOMAIN, entry_id)})
+        result: dict[str, Any] = {
+            "entry_id": entry_id,
+            "device_id": device.id if device else None,
+            "name": coordinator.data.system_name or coordinator.config_entry.title,
+            "ok": False,
+            "error": None,
+        }
+        frame = coordinator.data.accepted(params)
+        result["params"] = frame
+        if not frame:
+            result["error"] = "none of the params is reported by this device"
+            return result
+        async with semaphore:
+            t0 = time.monotonic()
+            try:
+                await data[DATA_CLIENT].set_device_params(frame)
+            except Exception as exc:  # one failing unit must not abort the group
+                _LOGGER.debug("set_group write to %s failed: %s", entry_id, exc)
+                result["error"] = f"{type(exc).__name__}: {exc}"
+            else:
+                result["ok"] = True
+            result["write_ms"] = _ms(time.monotonic() - t0)
+        return result
+
+    results = await asyncio.gather(*(_write(eid, data) for eid, data in targets.items()))
+    written = time.monotonic()
+
+    async def _refresh(data: dict) -> None:
+        async with semaphore:
+            await data[DATA_COORDINATOR].async_refresh()
+
+    await asyncio.gather(*(_refresh(data) for data in targets.values()))
+    finished = time.monotonic()
+
+    return {
+        "results": list(results),
+        "succeeded": sum(1 for r in results if r["ok"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "write_ms": _ms(written - started),
+        "refresh_ms": _ms(finished - written),
+        "total_ms": _ms(finished - started),
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration-wide services."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_GROUP):
+        return
+
+    async def _handle_set_group(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_group(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_GROUP,
+        _handle_set_group,
+        schema=SET_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
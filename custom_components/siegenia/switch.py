@@ -4,26 +4,17 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
 from .const import DOMAIN, DATA_CLIENT, DATA_COORDINATOR
-
-def _combined(data: dict | None) -> dict:
-    data = data or {}
-    merged = {}
-    for key in ("state", "params", "info"):
-        v = data.get(key) or {}
-        if isinstance(v, dict):
-            merged.update(v)
-    return merged
+from .entity import SiegeniaEntity
 
 # Automode Switch
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     async_add_entities([SiegeniaAutoModeSwitch(hass, entry)], True)
     async_add_entities([SiegeniaDeviceActiveSwitch(hass, entry)], True)
 
-class SiegeniaAutoModeSwitch(CoordinatorEntity, SwitchEntity):
+class SiegeniaAutoModeSwitch(SiegeniaEntity, SwitchEntity):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         coord = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
         super().__init__(coord)
@@ -36,30 +27,19 @@ class SiegeniaAutoModeSwitch(CoordinatorEntity, SwitchEntity):
         
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
-
-    def _d(self) -> dict:
-        return _combined(self.coordinator.data)
+        data = self.coordinator.data
+        return data.system_name if data else None
 
     @property
     def is_on(self) -> bool:
-        d = self._d()
-        return bool(d.get("automode", d.get("auto_mode", False)))
+        data = self.coordinator.data
+        return data.automode if data else False
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self._client.set_device_params({"automode": True, "auto_mode": True})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_params(self.coordinator.data.accepted({"automode": True}))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._client.set_device_params({"automode": False, "auto_mode": False})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_params(self.coordinator.data.accepted({"automode": False}))
 
     @property
     def device_info(self):
@@ -70,14 +50,9 @@ class SiegeniaAutoModeSwitch(CoordinatorEntity, SwitchEntity):
             "manufacturer": "Siegenia",
             "model": "Airoplus WRG Smart",
     }
-    
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("state", {}).get(self._key)
 
 # Device active Switch added
-class SiegeniaDeviceActiveSwitch(CoordinatorEntity, SwitchEntity):
+class SiegeniaDeviceActiveSwitch(SiegeniaEntity, SwitchEntity):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         coord = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
         super().__init__(coord)
@@ -90,30 +65,19 @@ class SiegeniaDeviceActiveSwitch(CoordinatorEntity, SwitchEntity):
         
     def _get_system_name(self) -> str | None:
         """Get the system name from device info."""
-        data = self.coordinator.data or {}
-        for part in ("state", "params", "info"):
-            d = data.get(part) or {}
-            if isinstance(d, dict):
-                system_name = d.get("systemname") or d.get("device_name")
-                if system_name:
-                    return system_name
-        return None
-
-    def _d(self) -> dict:
-        return _combined(self.coordinator.data)
+        data = self.coordinator.data
+        return data.system_name if data else None
 
     @property
     def is_on(self) -> bool:
-        d = self._d()
-        return bool(d.get("deviceactive", d.get("device_active", False)))
+        data = self.coordinator.data
+        return data.deviceactive if data else False
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self._client.set_device_params({"devicestate":{"deviceactive": True}})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_params(self.coordinator.data.accepted({"deviceactive": True}))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._client.set_device_params({"devicestate":{"deviceactive": False}})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_params(self.coordinator.data.accepted({"deviceactive": False}))
 
     @property
     def device_info(self):
@@ -124,8 +88,3 @@ class SiegeniaDeviceActiveSwitch(CoordinatorEntity, SwitchEntity):
             "manufacturer": "Siegenia",
             "model": "Airoplus WRG Smart",
         }
-        
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("state", {}).get(self._key)
\ No newline at end of file
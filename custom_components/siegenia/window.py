@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from typing import Optional
+
+
+def parse_windows(text: str) -> dict[str, list[int]]:
+    """Parse ``key=300,3600; other.key=900`` into ``{key: [seconds, ...]}``."""
+    result: dict[str, list[int]] = {}
+    for part in (text or "").replace("\n", ";").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        key, sep, values = part.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"invalid window spec: {part!r}")
+        seconds = sorted({int(v) for v in values.split(",") if v.strip()})
+        if not seconds or seconds[0] <= 0:
+            raise ValueError(f"invalid window spec: {part!r}")
+        result[key] = seconds
+    return result
+
+
+def format_windows(windows: dict[str, list[int]]) -> str:
+    return "; ".join(f"{k}={','.join(str(s) for s in v)}" for k, v in windows.items())
+
+
+def window_label(seconds: int) -> str:
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
+
+
+class RollingWindow:
+    """Time-windowed mean/min/max/trend over a fixed-size ring buffer.
+
+    Samples live in two preallocated ``array('d')`` rings. Min and max use
+    monotonic deques of sample sequence numbers, mean and the least-squares
+    slope use running sums, so every push is O(1) amortized and the memory
+    footprint is fixed by ``capacity``.
+    """
+
+    __slots__ = (
+        "window",
+        "capacity",
+        "min_spacing",
+        "_ts",
+        "_val",
+        "_head",
+        "_count",
+        "_seq",
+        "_min",
+        "_max",
+        "_ref",
+        "_sum_v",
+        "_sum_t",
+        "_sum_tt",
+        "_sum_tv",
+        "_since_rebase",
+    )
+
+    def __init__(self, window: float, capacity: int, min_spacing: float = 0.0) -> None:
+        self.window = float(window)
+        self.capacity = max(2, int(capacity))
+        self.min_spacing = float(min_spacing)
+        self._ts = array("d", bytes(8 * self.capacity))
+        self._val = array("d", bytes(8 * self.capacity))
+        self._head = 0  # sequence number of the oldest sample
+        self._count = 0
+        self._seq = 0  # sequence number of the next sample
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+        self._ref = 0.0
+        self._sum_v = 0.0
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+        self._sum_tv = 0.0
+        self._since_rebase = 0
+
+    @classmethod
+    def for_interval(cls, window: float, interval: float) -> "RollingWindow":
+        """Size the ring for ``window`` seconds of samples arriving every ``interval``."""
+        spacing = interval / 2
+        return cls(window, math.ceil(window / spacing), spacing)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _value(self, seq: int) -> float:
+        return self._val[seq % self.capacity]
+
+    def _pop_oldest(self) -> None:
+        idx = self._head % self.capacity
+        t = self._ts[idx] - self._ref
+        v = self._val[idx]
+        self._sum_v -= v
+        self._sum_t -= t
+        self._sum_tt -= t * t
+        self._sum_tv -= t * v
+        if self._min and self._min[0] == self._head:
+            self._min.popleft()
+        if self._max and self._max[0] == self._head:
+            self._max.popleft()
+        self._head += 1
+        self._count -= 1
+
+    def _rebase(self) -> None:
+        # Keep the regression sums numerically small by re-centering them
+        # once per ring turn; amortized this is still O(1) per push.
+        self._ref = self._ts[self._head % self.capacity] if self._count else 0.0
+        self._sum_v = self._sum_t = self._sum_tt = self._sum_tv = 0.0
+        for seq in range(self._head, self._seq):
+            idx = seq % self.capacity
+            t = self._ts[idx] - self._ref
+            v = self._val[idx]
+            self._sum_v += v
+            self._sum_t += t
+            self._sum_tt += t * t
+            self._sum_tv += t * v
+        self._since_rebase = 0
+
+    def push(self, ts: float, value: float) -> bool:
+        """Add a sample; returns False when it was skipped as too close to the last one."""
+        if self._count:
+            last = self._ts[(self._seq - 1) % self.capacity]
+            if ts - last < self.min_spacing:
+                return False
+        self.evict(ts)
+        if self._count == self.capacity:
+            self._pop_oldest()
+
+        seq = self._seq
+        idx = seq % self.capacity
+        self._ts[idx] = ts
+        self._val[idx] = value
+        self._seq += 1
+        self._count += 1
+
+        while self._min and self._value(self._min[-1]) >= value:
+            self._min.pop()
+        self._min.append(seq)
+        while self._max and self._value(self._max[-1]) <= value:
+            self._max.pop()
+        self._max.append(seq)
+
+        if self._count == 1:
+            self._ref = ts
+        t = ts - self._ref
+        self._sum_v += value
+        self._sum_t += t
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+        self._since_rebase += 1
+        if self._since_rebase >= self.capacity:
+            self._rebase()
+        return True
+
+    def evict(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._count and self._ts[self._head % self.capacity] < cutoff:
+            self._pop_oldest()
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum_v / self._count if self._count else None
+
+    @property
+    def minimum(self) -> Optional[float]:
+        return self._value(self._min[0]) if self._min else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        return self._value(self._max[0]) if self._max else None
+
+    @property
+    def trend(self) -> Optional[float]:
+        """Least-squares slope in units per hour."""
+        n = self._count
+        if n < 2:
+            return None
+        denom = n * self._sum_tt - self._sum_t * self._sum_t
+        if denom <= 0:
+            return None
+        return (n * self._sum_tv - self._sum_t * self._sum_v) / denom * 3600
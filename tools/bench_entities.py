@@ -0,0 +1,190 @@
+"""Benchmark the per-update cost of the entity layer with synthetic payloads.
+
+Builds realistic and oversized ``coordinator.data`` snapshots and times
+parsing (``DeviceData.parse``/``_flatten``), sensor discovery and the state
+properties of every platform. Results are compared with a stored baseline:
+
+    python tools/bench_entities.py                # compare with tools/bench_baseline.json
+    python tools/bench_entities.py --save         # store the current run as baseline
+    python tools/bench_entities.py --fail-above 1.5
+
+Needs Home Assistant installed, since the platforms import it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.siegenia import binary_sensor, fan, number, sensor, switch  # noqa: E402
+from custom_components.siegenia.api import ConnectionState  # noqa: E402
+from custom_components.siegenia.const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN  # noqa: E402
+from custom_components.siegenia.model import DeviceData, _flatten  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).with_name("bench_baseline.json")
+
+
+def realistic_payload() -> tuple[dict, dict, dict]:
+    state = {
+        "airbase": {
+            "humidity": {"indoor": 48.5, "outdoor": 81.0},
+            "temperature": {"indoor": 21.4, "outdoor": 3.2},
+        },
+        "co2_value": 742,
+        "airquality": 1,
+        "connection": "wifi",
+        "devicestate": {"deviceactive": True},
+        "warnings": [],
+    }
+    params = {
+        "systemname": "Bedroom",
+        "fanpower": 45,
+        "fanmode": 1,
+        "automode": False,
+        "maxfanpower": 60,
+        "maxfanpowermanual": 80,
+        "timer": {"enabled": False, "duration": {"hour": 0, "minute": 30}},
+    }
+    info = {
+        "serialnr": "AP-0012345",
+        "softwareversion": "1.7.4",
+        "hardwareversion": "2",
+        "type": 6,
+        "devicename": "AEROPLUS",
+    }
+    return state, params, info
+
+
+def _nested(depth: int, width: int, prefix: str) -> dict:
+    if depth == 0:
+        return {f"{prefix}{i}": i * 0.5 for i in range(width)}
+    return {f"{prefix}{i}": _nested(depth - 1, width, prefix) for i in range(width)}
+
+
+def oversized_payload() -> tuple[dict, dict, dict]:
+    state, params, info = realistic_payload()
+    state = dict(state, extra=_nested(4, 6, "s"))  # 6**5 = 7776 leaves
+    params = dict(params, **{f"param{i}": i for i in range(500)})
+    info = dict(info, history=_nested(2, 20, "h"))  # 8000 leaves
+    return state, params, info
+
+
+class _Coordinator(SimpleNamespace):
+    last_update_success = True
+
+    def async_add_listener(self, _update: Callable[[], None], _context: Any = None) -> Callable[[], None]:
+        return lambda: None
+
+
+def _build(payload: tuple[dict, dict, dict]) -> dict[str, Any]:
+    client = SimpleNamespace(
+        connected=True,
+        state=ConnectionState.CONNECTED,
+        add_state_listener=lambda _cb: (lambda: None),
+    )
+    entry = SimpleNamespace(entry_id="bench", data={"host": "192.0.2.1"}, options={}, async_on_unload=lambda _f: None)
+    coordinator = _Coordinator(data=DeviceData.parse(*payload), client=client, config_entry=entry)
+    hass = SimpleNamespace(data={DOMAIN: {"bench": {DATA_CLIENT: client, DATA_COORDINATOR: coordinator}}})
+    return {
+        "payload": payload,
+        "coordinator": coordinator,
+        "entry": entry,
+        "key_sensors": sensor._key_sensors(coordinator, entry),
+        "fan": fan.SiegeniaFanEntity(client, coordinator, entry),
+        "number": number.SiegeniaFanPowerNumber(hass, entry),
+        "automode": switch.SiegeniaAutoModeSwitch(hass, entry),
+        "deviceactive": switch.SiegeniaDeviceActiveSwitch(hass, entry),
+        "online": binary_sensor.SiegeniaOnlineBinarySensor(client, coordinator, entry),
+    }
+
+
+def _cases(ctx: dict[str, Any]) -> dict[str, Callable[[], Any]]:
+    state, params, info = ctx["payload"]
+    combined = {**state, **params, **info}
+    key_sensors = ctx["key_sensors"]
+    fan_entity = ctx["fan"]
+    number_entity = ctx["number"]
+    coordinator, entry = ctx["coordinator"], ctx["entry"]
+    return {
+        "model.flatten": lambda: _flatten(combined),
+        "model.parse": lambda: DeviceData.parse(state, params, info),
+        "sensor.discovery": lambda: (
+            sensor._key_sensors(coordinator, entry),
+            sensor._setup_windows(entry, coordinator, coordinator.data.flat),
+        ),
+        "sensor.native_value(all)": lambda: [s.native_value for s in key_sensors],
+        "fan.is_on+percentage": lambda: (fan_entity.is_on, fan_entity.percentage),
+        "fan.extra_state_attributes": lambda: fan_entity.extra_state_attributes,
+        "number.native_value+max": lambda: (number_entity.native_value, number_entity.native_max_value),
+        "switch.is_on(all)": lambda: (ctx["automode"].is_on, ctx["deviceactive"].is_on),
+        "binary_sensor.is_on": lambda: ctx["online"].is_on,
+    }
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    timer = timeit.Timer(func)
+    number_, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number_))
+    return best / number_ * 1e9  # ns per call
+
+
+def run(repeat: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, payload in (("realistic", realistic_payload()), ("oversized", oversized_payload())):
+        for case, func in _cases(_build(payload)).items():
+            results[f"{name}/{case}"] = _time(func, repeat)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fail-above", type=float, default=None, help="exit 1 if any case is slower by this ratio")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    baseline: dict[str, float] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text()).get("results", {})
+
+    rows = []
+    regressed = False
+    for name, ns in results.items():
+        base = baseline.get(name)
+        ratio = ns / base if base else None
+        if args.fail_above and ratio and ratio > args.fail_above:
+            regressed = True
+        rows.append({"case": name, "ns": round(ns, 1), "baseline_ns": base, "ratio": None if ratio is None else round(ratio, 2)})
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        width = max(len(r["case"]) for r in rows)
+        print(f"{'case'.ljust(width)}  {'ns/call':>12}  {'baseline':>12}  ratio")
+        for r in rows:
+            base = "-" if r["baseline_ns"] is None else f"{r['baseline_ns']:.1f}"
+            ratio = "-" if r["ratio"] is None else f"{r['ratio']:.2f}"
+            print(f"{r['case'].ljust(width)}  {r['ns']:>12.1f}  {base:>12}  {ratio}")
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps({"python": platform.python_version(), "machine": platform.machine(), "results": results}, indent=2)
+            + "\n"
+        )
+        print(f"Baseline written to {args.baseline}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
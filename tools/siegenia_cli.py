@@ -0,0 +1,160 @@
+"""Poll, watch or benchmark Siegenia devices concurrently, outside Home Assistant.
+
+Examples:
+    python tools/siegenia_cli.py poll 10.0.0.21 10.0.0.22 -u admin -p secret
+    python tools/siegenia_cli.py bench 10.0.0.2{1..8} -u admin -p secret -n 50 -c 4
+    python tools/siegenia_cli.py watch 10.0.0.21 -u admin -p secret --seconds 120 --json
+
+Only aiohttp is required; the client module is loaded directly so the
+integration package (and with it Home Assistant) is never imported.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "siegenia"))
+
+from api import SiegeniaClient  # noqa: E402
+
+POLL_COMMANDS = ("getDeviceState", "getDeviceParams", "getDevice")
+
+
+def _percentile(values: list[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value * 1000, 1)
+
+
+async def _run_host(host: str, args: argparse.Namespace) -> dict[str, Any]:
+    client = SiegeniaClient(
+        host,
+        args.username,
+        args.password,
+        port=args.port,
+        use_ssl=not args.no_ssl,
+        compress=not args.no_deflate,
+        timeout_floor=args.timeout_floor,
+        timeout_ceiling=args.timeout_ceiling,
+        account_wire_bytes=True,
+    )
+    result: dict[str, Any] = {"host": host, "error": None}
+    rtts: list[float] = []
+    failures = 0
+    pushes = 0
+    try:
+        await asyncio.wait_for(client.connect(), timeout=args.connect_timeout)
+        if args.mode == "watch":
+            subscription = client.subscribe(maxsize=1024)
+
+            async def _count() -> None:
+                nonlocal pushes
+                async for _frame in subscription:
+                    pushes += 1
+
+            counter = asyncio.create_task(_count())
+            await asyncio.sleep(args.seconds)
+            subscription.close()
+            await counter
+        else:
+            rounds = 1 if args.mode == "poll" else args.count
+            for _ in range(rounds):
+                for command in POLL_COMMANDS:
+                    started = time.perf_counter()
+                    try:
+                        await client._send(command)
+                    except Exception:
+                        failures += 1
+                        continue
+                    rtts.append(time.perf_counter() - started)
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        await client.close()
+
+    stats = client.stats
+    requests = len(rtts) + failures
+    result.update(
+        {
+            "connect_ms": _ms(stats.connect_seconds),
+            "login_ms": _ms(stats.login_seconds),
+            "requests": requests,
+            "error_rate": round(failures / requests, 3) if requests else None,
+            "rtt_p50_ms": _ms(_percentile(rtts, 50)),
+            "rtt_p95_ms": _ms(_percentile(rtts, 95)),
+            "rtt_mean_ms": _ms(statistics.fmean(rtts)) if rtts else None,
+            "frames_in": stats.frames_in,
+            "bytes_in": stats.bytes_in,
+            "wire_bytes_in": stats.wire_bytes_in,
+            "max_frame_in": stats.max_frame_in,
+            "bytes_out": stats.bytes_out,
+            "wire_bytes_out": stats.wire_bytes_out,
+            "deflate": stats.compress,
+            "timeouts": stats.timeouts,
+            "timeout_ms": {c: _ms(client.rtt_estimator(c).timeout) for c in POLL_COMMANDS},
+        }
+    )
+    if args.mode == "watch":
+        result["pushes"] = pushes
+    return result
+
+
+async def _run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def _bounded(host: str) -> dict[str, Any]:
+        async with semaphore:
+            return await _run_host(host, args)
+
+    return list(await asyncio.gather(*(_bounded(host) for host in args.hosts)))
+
+
+def _print_table(rows: list[dict[str, Any]]) -> None:
+    columns = list(rows[0].keys()) if rows else []
+    cells = [[("-" if row.get(c) is None else str(row.get(c))) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for r in cells:
+        print("  ".join(v.ljust(w) for v, w in zip(r, widths)))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("poll", "watch", "bench"))
+    parser.add_argument("hosts", nargs="+")
+    parser.add_argument("-u", "--username", required=True)
+    parser.add_argument("-p", "--password", required=True)
+    parser.add_argument("--port", type=int, default=443)
+    parser.add_argument("--no-ssl", action="store_true", help="use ws:// instead of wss://")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="devices handled in parallel")
+    parser.add_argument("-n", "--count", type=int, default=20, help="poll rounds per device in bench mode")
+    parser.add_argument("--seconds", type=float, default=60.0, help="watch duration")
+    parser.add_argument("--connect-timeout", type=float, default=10.0, help="connect and login timeout in seconds")
+    parser.add_argument("--timeout-floor", type=float, default=1.0, help="lower bound of adaptive request timeouts")
+    parser.add_argument("--timeout-ceiling", type=float, default=10.0, help="upper bound of adaptive request timeouts")
+    parser.add_argument("--no-deflate", action="store_true", help="do not offer permessage-deflate")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_run(args))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_table(rows)
+    return 1 if any(row["error"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
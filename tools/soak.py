@@ -0,0 +1,287 @@
+"""Soak SiegeniaClient against a local fake device that injects faults.
+
+The fake device drops replies, delays them, answers with unknown ids, goes
+half-open (socket stays up, nothing is answered) and disconnects in the
+middle of a frame, each at a configurable rate. The client is polled like
+the coordinator does, while memory, the pending-request table, asyncio
+tasks and recovery times are sampled. The run fails when any of them keeps
+growing or recovery takes too long:
+
+    python tools/soak.py --duration 600
+    python tools/soak.py --duration 259200 --half-open 0.001 --json > soak.json
+
+Only aiohttp is required; the client module is loaded directly.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional
+
+from aiohttp import WSMsgType, web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "siegenia"))
+
+from api import SiegeniaClient  # noqa: E402
+
+STATE = {
+    "airbase": {"humidity": {"indoor": 48.5, "outdoor": 81.0}, "temperature": {"indoor": 21.4, "outdoor": 3.2}},
+    "co2_value": 742,
+    "devicestate": {"deviceactive": True},
+}
+PARAMS = {"systemname": "Soak", "fanpower": 45, "fanmode": 1, "automode": False, "maxfanpower": 60}
+INFO = {"serialnr": "SOAK-1", "softwareversion": "1.7.4", "type": 6}
+REPLIES = {"getDeviceState": STATE, "getDeviceParams": PARAMS, "getDevice": INFO}
+
+
+class FakeDevice:
+    """WebSocket server speaking enough of the Siegenia protocol to be polled."""
+
+    def __init__(self, args: argparse.Namespace, rng: random.Random) -> None:
+        self._args = args
+        self._rng = rng
+        self._runner: Optional[web.AppRunner] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.faults: dict[str, int] = {"drop": 0, "delay": 0, "unknown_id": 0, "half_open": 0, "mid_frame": 0}
+        self.connections = 0
+
+    async def start(self) -> int:
+        app = web.Application()
+        app.router.add_get("/WebSocket", self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._runner:
+            await self._runner.cleanup()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reply_later(self, ws: web.WebSocketResponse, delay: float, frame: str) -> None:
+        await asyncio.sleep(delay)
+        if not ws.closed:
+            await ws.send_str(frame)
+
+    def _roll(self, name: str) -> bool:
+        if self._rng.random() < getattr(self._args, name):
+            self.faults[name] += 1
+            return True
+        return False
+
+    async def _handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        half_open = False
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT or half_open:
+                continue
+            req = json.loads(msg.data)
+            rid = req.get("id")
+            command = req.get("command")
+            data: Any = {"token": "soak-token"} if command == "login" else REPLIES.get(command, {})
+            frame = json.dumps({"id": rid, "status": "ok", "data": data})
+
+            if self._roll("half_open"):
+                half_open = True
+                continue
+            if self._roll("mid_frame"):
+                await ws.send_str(frame[: len(frame) // 2])
+                if request.transport is not None:
+                    request.transport.abort()
+                break
+            if self._roll("drop"):
+                continue
+            if self._roll("unknown_id"):
+                await ws.send_str(json.dumps({"id": rid + 1_000_000, "status": "ok", "data": data}))
+            if self._roll("delay"):
+                self._spawn(self._reply_later(ws, self._rng.uniform(0, self._args.delay_max), frame))
+                continue
+            await ws.send_str(frame)
+            if self._rng.random() < self._args.push:
+                await ws.send_str(json.dumps({"command": "deviceParams", "data": PARAMS}))
+        return ws
+
+
+class Sample:
+    __slots__ = ("t", "memory", "pending", "tasks", "subscribed")
+
+    def __init__(self, t: float, memory: int, pending: int, tasks: int, subscribed: int) -> None:
+        self.t = t
+        self.memory = memory
+        self.pending = pending
+        self.tasks = tasks
+        self.subscribed = subscribed
+
+
+def _grows(values: list[float], factor: float, slack: float) -> bool:
+    """True when the last quarter's peak exceeds the first half's peak beyond tolerance."""
+    if len(values) < 8:
+        return False
+    half = values[: len(values) // 2]
+    tail = values[-(len(values) // 4):]
+    return max(tail) > max(half) * factor + slack
+
+
+async def soak(args: argparse.Namespace) -> dict[str, Any]:
+    rng = random.Random(args.seed)
+    device = FakeDevice(args, rng)
+    port = await device.start()
+    client = SiegeniaClient(
+        "127.0.0.1",
+        "soak",
+        "soak",
+        port=port,
+        use_ssl=False,
+        heartbeat_seconds=args.heartbeat,
+        timeout_floor=args.timeout_floor,
+        timeout_ceiling=args.timeout_ceiling,
+    )
+    pushes = client.subscribe(maxsize=8)
+    received = 0
+
+    async def _drain() -> None:
+        nonlocal received
+        async for _frame in pushes:
+            received += 1
+
+    drain = asyncio.create_task(_drain())
+
+    tracemalloc.start()
+    samples: list[Sample] = []
+    recoveries: list[float] = []
+    failed_since: Optional[float] = None
+    polls = failures = 0
+    started = time.monotonic()
+    next_sample = started + args.warmup
+
+    while (now := time.monotonic()) - started < args.duration:
+        polls += 1
+        try:
+            if not client.connected:
+                await client.connect()
+            await client.get_device_state()
+            await client.get_device_params()
+            await client.get_device()
+        except Exception:
+            failures += 1
+            if failed_since is None:
+                failed_since = now
+        else:
+            if failed_since is not None:
+                recoveries.append(time.monotonic() - failed_since)
+                failed_since = None
+
+        if now >= next_sample:
+            gc.collect()
+            samples.append(
+                Sample(
+                    now - started,
+                    tracemalloc.get_traced_memory()[0],
+                    len(client._pending),
+                    len(asyncio.all_tasks()),
+                    len(pushes),
+                )
+            )
+            next_sample = now + args.sample_every
+        await asyncio.sleep(args.interval)
+
+    pushes.close()
+    await drain
+    await client.close()
+    await device.stop()
+    tracemalloc.stop()
+
+    problems: list[str] = []
+    if _grows([s.memory for s in samples], 1.10, args.memory_slack * 1024):
+        problems.append("memory keeps growing")
+    if _grows([s.tasks for s in samples], 1.0, 2):
+        problems.append("asyncio task count keeps growing")
+    if any(s.pending > args.max_pending for s in samples):
+        problems.append(f"pending table exceeded {args.max_pending} entries")
+    if recoveries and max(recoveries) > args.max_recovery:
+        problems.append(f"recovery took {max(recoveries):.1f}s (limit {args.max_recovery}s)")
+    if failed_since is not None and time.monotonic() - failed_since > args.max_recovery:
+        problems.append("client did not recover before the end of the run")
+
+    return {
+        "ok": not problems,
+        "problems": problems,
+        "duration_s": round(time.monotonic() - started, 1),
+        "polls": polls,
+        "failed_polls": failures,
+        "device_connections": device.connections,
+        "faults": device.faults,
+        "pushes_received": received,
+        "pushes_dropped": pushes.dropped,
+        "recovery_s": {
+            "count": len(recoveries),
+            "max": round(max(recoveries), 2) if recoveries else None,
+            "mean": round(sum(recoveries) / len(recoveries), 2) if recoveries else None,
+        },
+        "memory_kib": {
+            "first": samples[0].memory // 1024 if samples else None,
+            "last": samples[-1].memory // 1024 if samples else None,
+            "peak": max(s.memory for s in samples) // 1024 if samples else None,
+        },
+        "pending_max": max((s.pending for s in samples), default=0),
+        "tasks_max": max((s.tasks for s in samples), default=0),
+        "client_stats": {k: v for k, v in client.stats.as_dict().items() if k != "commands"},
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=600.0, help="run length in seconds")
+    parser.add_argument("--interval", type=float, default=0.2, help="pause between polls")
+    parser.add_argument("--seed", type=int, default=1)
+    faults = parser.add_argument_group("fault rates (per request)")
+    faults.add_argument("--drop", type=float, default=0.02)
+    faults.add_argument("--delay", type=float, default=0.05)
+    faults.add_argument("--delay-max", type=float, default=3.0, help="longest reply delay in seconds")
+    faults.add_argument("--unknown-id", type=float, default=0.02)
+    faults.add_argument("--half-open", type=float, default=0.002)
+    faults.add_argument("--mid-frame", type=float, default=0.002)
+    faults.add_argument("--push", type=float, default=0.05, help="rate of unsolicited push frames")
+    client = parser.add_argument_group("client")
+    client.add_argument("--heartbeat", type=float, default=5.0)
+    client.add_argument("--timeout-floor", type=float, default=0.5)
+    client.add_argument("--timeout-ceiling", type=float, default=5.0)
+    limits = parser.add_argument_group("limits")
+    limits.add_argument("--warmup", type=float, default=30.0, help="seconds before the first sample")
+    limits.add_argument("--sample-every", type=float, default=10.0)
+    limits.add_argument("--max-pending", type=int, default=8)
+    limits.add_argument("--max-recovery", type=float, default=90.0, help="seconds")
+    limits.add_argument("--memory-slack", type=int, default=512, help="KiB tolerated on top of 10%% growth")
+    parser.add_argument("--log-level", default="error", help="client log level; injected faults log warnings")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper())
+    result = asyncio.run(soak(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())